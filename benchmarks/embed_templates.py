@@ -0,0 +1,87 @@
+"""
+Compare building each read-mostly embed from scratch against copying a cached
+template, as bot.py's cached_embed does.
+
+Run from the repository root (needs discord.py and the MODE_*.json files):
+
+    python benchmarks/embed_templates.py --mode nightform --iterations 5000
+
+Importing bot.py would start the bot, so the embed builders are lifted out of
+the source and run against a synthetic guild config.
+"""
+
+import argparse
+import ast
+import json
+import os
+import time
+
+import discord
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+BOT_PATH = os.path.join(ROOT, "bot.py")
+BUILDERS = [
+    ("moodcheck", "build_moodcheck_embed", False),
+    ("help", "build_help_template", True),
+    ("adminhelp", "build_adminhelp_embed", False),
+    ("listlanguages", "build_listlanguages_embed", True),
+    ("langcodes", "build_langcodes_embed", False),
+    ("formcompendium", "build_formcompendium_embed", False),
+]
+GUILD_ID = "1"
+
+def load_json_file(name):
+    with open(os.path.join(ROOT, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_builders(languages):
+    with open(BOT_PATH, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), BOT_PATH)
+
+    names = {name for _, name, _ in BUILDERS}
+    module = ast.Module(
+        body=[node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name in names],
+        type_ignores=[]
+    )
+    namespace = {
+        "discord": discord,
+        "MODE_COLORS": load_json_file("MODE_COLORS.json"),
+        "MODE_DESCRIPTIONS": load_json_file("MODE_DESCRIPTIONS.json"),
+        "MODE_FOOTERS": load_json_file("MODE_FOOTERS.json"),
+        "all_languages": {"guilds": {GUILD_ID: {"languages": languages}}},
+    }
+    exec(compile(module, BOT_PATH, "exec"), namespace)
+    return namespace
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", default="dayform")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--languages", type=int, default=12, help="languages configured in the synthetic guild")
+    args = parser.parse_args()
+
+    languages = {f"l{i}": {"name": f"Language {i}"} for i in range(args.languages)}
+    namespace = load_builders(languages)
+    avatar_url = "https://cdn.discordapp.com/avatars/0/0.png"
+
+    print(f"CPU per call in {args.mode}, {args.iterations} iterations")
+    for kind, name, scoped in BUILDERS:
+        builder = namespace[name]
+        key_mode = avatar_url if kind == "formcompendium" else args.mode
+        scope = GUILD_ID if scoped else None
+
+        started = time.process_time()
+        for _ in range(args.iterations):
+            builder(key_mode, scope)
+        built = (time.process_time() - started) / args.iterations * 1e6
+
+        template = builder(key_mode, scope)
+        started = time.process_time()
+        for _ in range(args.iterations):
+            template.copy()
+        copied = (time.process_time() - started) / args.iterations * 1e6
+
+        print(f"{kind:>15} | build {built:7.1f} µs | cached {copied:6.1f} µs | {built / max(copied, 1e-9):5.1f}x faster")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare memory and lookup time of the old {"user_id": "lang"} dict layout
+against bot.py's UserLanguageIndex.
+
+Run from the repository root:
+
+    python benchmarks/user_language_index.py 10000 100000 1000000
+
+Importing bot.py would start the bot, so the index and its interned code
+table are lifted out of the source and executed on their own.
+"""
+
+import argparse
+import ast
+import json
+import os
+import random
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import MutableMapping
+
+BOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "bot.py")
+INDEX_NAMES = {"LANGUAGE_CODES", "LANGUAGE_CODE_IDS", "intern_language_code", "UserLanguageIndex"}
+CODES = ["en", "de", "fr", "es", "ja", "ko", "pt", "it"]
+
+def load_user_language_index():
+    with open(BOT_PATH, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), BOT_PATH)
+
+    def defines(node):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            return node.name in INDEX_NAMES
+        if isinstance(node, ast.Assign):
+            return any(isinstance(target, ast.Name) and target.id in INDEX_NAMES for target in node.targets)
+        return False
+
+    module = ast.Module(body=[node for node in tree.body if defines(node)], type_ignores=[])
+    namespace = {"array": array, "bisect_left": bisect_left, "defaultdict": defaultdict, "MutableMapping": MutableMapping}
+    exec(compile(module, BOT_PATH, "exec"), namespace)
+    return namespace["UserLanguageIndex"]
+
+def benchmark(index_class, size, lookups):
+    user_ids = random.sample(range(10**17, 10**18), size)
+    # Decode from JSON so each language code is its own string, as after loading a shard
+    payload = json.dumps({str(user_id): random.choice(CODES) for user_id in user_ids})
+    probes = [str(random.choice(user_ids)) for _ in range(lookups)]
+
+    row = {"members": size}
+    for layout, build in (("dict", lambda: json.loads(payload)), ("index", lambda: index_class(json.loads(payload)))):
+        tracemalloc.start()
+        users = build()
+        row[f"{layout}_bytes"] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        started = time.perf_counter()
+        for user_id in probes:
+            users.get(user_id)
+        row[f"{layout}_lookup_ns"] = (time.perf_counter() - started) / lookups * 1e9
+        del users
+    return row
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[10_000, 100_000], help="member counts to measure")
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    index_class = load_user_language_index()
+    for size in args.sizes:
+        row = benchmark(index_class, size, args.lookups)
+        print(
+            f"{row['members']:>10,} members | "
+            f"dict {row['dict_bytes'] / 2**20:7.1f} MiB {row['dict_lookup_ns']:5.0f} ns/lookup | "
+            f"index {row['index_bytes'] / 2**20:7.1f} MiB {row['index_lookup_ns']:5.0f} ns/lookup | "
+            f"{row['dict_bytes'] / max(row['index_bytes'], 1):.0f}x smaller"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,10 @@ from discord.ui import View, Button, Select
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 import random
+import copy
 import json
 import os
+import re
 import asyncio
 from googletrans import Translator
 
@@ -40,19 +42,1627 @@ intents = discord.Intents.default()
 intents.members = True
 intents.message_content = True
 bot = commands.Bot(command_prefix="!", help_command=None, intents=intents)
-translator = Translator()
 tree = bot.tree
 
+# ========== TRANSLATION ENGINE ==========
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+import sqlite3
+import threading
+import time
+import unicodedata
+
+TRANSLATION_BACKEND = os.getenv("WHISPERLING_TRANSLATOR", "googletrans").lower()
+OFFLINE_TRANSLATION_LATENCY_MS = int(os.getenv("WHISPERLING_OFFLINE_LATENCY_MS", "0"))
+OFFLINE_TRANSLATION_DICTIONARY = os.getenv("WHISPERLING_OFFLINE_DICTIONARY")
+TRANSLATION_WORKERS = int(os.getenv("WHISPERLING_TRANSLATION_WORKERS", "4"))
+TRANSLATION_CACHE_FILE = os.getenv(
+    "WHISPERLING_TRANSLATION_CACHE",
+    # Keep pseudo-translations from the offline backend out of the real cache
+    "translation_cache_offline.db" if TRANSLATION_BACKEND == "offline" else "translation_cache.db"
+)
+TRANSLATION_TIMEOUT = float(os.getenv("WHISPERLING_TRANSLATION_TIMEOUT", "8"))
+TRANSLATION_HEDGING = os.getenv("WHISPERLING_TRANSLATION_HEDGE", "0") == "1"
+TRANSLATION_BREAKER_WINDOW = int(os.getenv("WHISPERLING_BREAKER_WINDOW", "20"))
+TRANSLATION_BREAKER_MIN_CALLS = int(os.getenv("WHISPERLING_BREAKER_MIN_CALLS", "5"))
+TRANSLATION_BREAKER_FAILURE_RATIO = float(os.getenv("WHISPERLING_BREAKER_FAILURE_RATIO", "0.5"))
+TRANSLATION_BREAKER_COOLDOWN = float(os.getenv("WHISPERLING_BREAKER_COOLDOWN", "60"))
+TRANSLATION_CACHE_MEMORY_SIZE = int(os.getenv("WHISPERLING_TRANSLATION_CACHE_MEMORY", "2048"))
+TRANSLATION_CACHE_DISK_SIZE = int(os.getenv("WHISPERLING_TRANSLATION_CACHE_DISK", "100000"))
+TRANSLATION_CACHE_TTL = int(os.getenv("WHISPERLING_TRANSLATION_CACHE_TTL", str(30 * 24 * 60 * 60)))
+
+class TranslationBackend(ABC):
+    """
+    Blocking translation backend. TranslationService always calls these
+    methods from its worker pool, never from the event loop.
+    """
+
+    name = "base"
+    native_batch = False  # True if translate_batch costs one round trip
+
+    @abstractmethod
+    def translate(self, text: str, dest: str, src: str = "auto") -> str:
+        """Translate one string into dest."""
+
+    def translate_batch(self, texts, dest: str, src: str = "auto"):
+        return [self.translate(text, dest, src) for text in texts]
+
+    @abstractmethod
+    def detect(self, text: str) -> str:
+        """Return the language code of text, or "und" if it can't tell."""
+
+class GoogleTransBackend(TranslationBackend):
+    """The unofficial Google endpoint via googletrans."""
+
+    name = "googletrans"
+
+    def __init__(self, translator):
+        self.translator = translator
+
+    def translate(self, text, dest, src="auto"):
+        return self.translator.translate(text, dest=dest, src=src).text
+
+    def translate_batch(self, texts, dest, src="auto"):
+        return [result.text for result in self.translator.translate(list(texts), dest=dest, src=src)]
+
+    def detect(self, text):
+        return self.translator.detect(text).lang
+
+class OfflineBackend(TranslationBackend):
+    """
+    Deterministic local stand-in for load tests and benchmarks: dictionary
+    entries first, pseudo-localization otherwise, plus artificial latency.
+    """
+
+    name = "offline"
+    native_batch = True
+    PSEUDO_ACCENTS = str.maketrans("aeiouyAEIOUYcnsz", "áéíóúýÁÉÍÓÚÝçñšž")
+
+    def __init__(self, latency_ms=0, dictionary=None):
+        self.latency = latency_ms / 1000
+        self.dictionary = dictionary or {}  # dest -> {source text: translation}
+
+    def _lookup(self, text, dest):
+        known = self.dictionary.get(dest, {}).get(text)
+        if known is not None:
+            return known
+        return f"[{dest}] {text.translate(self.PSEUDO_ACCENTS)}"
+
+    def translate(self, text, dest, src="auto"):
+        time.sleep(self.latency)
+        return self._lookup(text, dest)
+
+    def translate_batch(self, texts, dest, src="auto"):
+        time.sleep(self.latency)
+        return [self._lookup(text, dest) for text in texts]
+
+    def detect(self, text):
+        return "und"  # undetermined: no real detection offline
+
+def build_translation_backend():
+    if TRANSLATION_BACKEND == "offline":
+        dictionary = load_json_file(OFFLINE_TRANSLATION_DICTIONARY) if OFFLINE_TRANSLATION_DICTIONARY else {}
+        print(f"🧪 Using offline translation backend ({OFFLINE_TRANSLATION_LATENCY_MS} ms latency).")
+        return OfflineBackend(OFFLINE_TRANSLATION_LATENCY_MS, dictionary)
+
+    if TRANSLATION_BACKEND != "googletrans":
+        print(f"⚠️ Unknown translation backend '{TRANSLATION_BACKEND}', falling back to googletrans.")
+    return GoogleTransBackend(Translator())
+
+def normalize_translation_text(text: str) -> str:
+    return unicodedata.normalize("NFC", text).strip()
+
+class TranslationCache:
+    """
+    Two-tier translation cache keyed by (normalized text, source, dest):
+    a bounded in-process LRU in front of a local SQLite store, both with TTL.
+
+    The LRU and the database have separate locks. Memory lookups run on the
+    event loop, so they must never wait behind a SQLite query or prune.
+    """
+
+    PRUNE_EVERY = 500
+
+    def __init__(self, path, memory_size, disk_size, ttl):
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self.ttl = ttl
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()  # guards self.memory only; held for dict operations, never I/O
+        self.db_lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes_since_prune = 0
+
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                text TEXT NOT NULL,
+                src TEXT NOT NULL,
+                dest TEXT NOT NULL,
+                translated TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (text, src, dest)
+            )
+            """
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS translations_created_at ON translations (created_at)")
+        self.db.commit()
+        self.warm()
+
+    def _remember(self, key, translated, created_at):
+        with self.lock:
+            self.memory[key] = (translated, created_at)
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.memory_size:
+                self.memory.popitem(last=False)
+                self.evictions += 1
+
+    def warm(self):
+        """Preload the most recently stored translations so restarts start warm."""
+        cutoff = time.time() - self.ttl
+        with self.db_lock:
+            rows = self.db.execute(
+                "SELECT text, src, dest, translated, created_at FROM translations "
+                "WHERE created_at >= ? ORDER BY created_at DESC LIMIT ?",
+                (cutoff, self.memory_size)
+            ).fetchall()
+        for text, src, dest, translated, created_at in reversed(rows):
+            self._remember((text, src, dest), translated, created_at)
+
+    def get_memory(self, key):
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is None:
+                return None
+            translated, created_at = entry
+            if time.time() - created_at > self.ttl:
+                del self.memory[key]
+                return None
+            self.memory.move_to_end(key)
+            self.memory_hits += 1
+            return translated
+
+    def get_disk(self, key):
+        """Blocking SQLite lookup; run it on the cache executor."""
+        with self.db_lock:
+            row = self.db.execute(
+                "SELECT translated, created_at FROM translations WHERE text = ? AND src = ? AND dest = ?",
+                key
+            ).fetchone()
+            if row is None or time.time() - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    def put(self, key, translated):
+        now = time.time()
+        self._remember(key, translated, now)
+        with self.db_lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO translations (text, src, dest, translated, created_at) VALUES (?, ?, ?, ?, ?)",
+                (*key, translated, now)
+            )
+            self.db.commit()
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.PRUNE_EVERY:
+                self._prune(now)
+
+    def _prune(self, now):
+        # Caller holds self.db_lock
+        self._writes_since_prune = 0
+        expired = self.db.execute("DELETE FROM translations WHERE created_at < ?", (now - self.ttl,)).rowcount
+        total = self.db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        overflow = max(total - self.disk_size, 0)
+        if overflow:
+            self.db.execute(
+                "DELETE FROM translations WHERE rowid IN "
+                "(SELECT rowid FROM translations ORDER BY created_at ASC LIMIT ?)",
+                (overflow,)
+            )
+        self.db.commit()
+        with self.lock:
+            self.evictions += expired + overflow
+
+    def stats(self):
+        with self.db_lock:
+            disk_entries = self.db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        with self.lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_entries": len(self.memory),
+                "disk_entries": disk_entries,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+class TranslationUnavailable(Exception):
+    """Raised when the backend is timing out, failing, or the circuit breaker is open."""
+
+class CircuitBreaker:
+    """
+    Tracks recent backend outcomes. Opens after too many failures so callers
+    fail fast, then lets a single probe through once the cooldown passes.
+
+    allow() hands each admitted call a ticket, and only outcomes recorded
+    with a current ticket count: a call admitted before the breaker tripped
+    can neither re-open it nor close it with a stale success.
+    """
+
+    def __init__(self, window, failure_ratio, min_calls, cooldown):
+        self.outcomes = deque(maxlen=window)  # True for success, False for failure
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self.generation = 0  # bumped on every trip and recovery; tickets from older generations are stale
+        self.probe = None  # ticket of the half-open probe in flight
+
+    def allow(self):
+        """Return a ticket for an admitted call, or None if it should fail fast."""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.cooldown:
+                self.rejected += 1
+                return None
+            self.state = "half_open"
+
+        if self.state == "half_open":
+            if self.probe is not None:
+                self.rejected += 1
+                return None
+            self.probe = object()
+            return self.probe
+        return self.generation
+
+    def finish(self, ticket):
+        """Free the half-open slot if this ticket holds it, however the call ended (including cancellation)."""
+        if ticket is self.probe:
+            self.probe = None
+
+    def record(self, ticket, success: bool):
+        if self.state == "half_open":
+            if ticket is not self.probe:
+                return  # only the probe decides whether the backend recovered
+            self.probe = None
+            if success:
+                self.state = "closed"
+                self.generation += 1
+                self.outcomes.clear()
+            else:
+                self._open()
+            return
+
+        if self.state == "open" or ticket != self.generation:
+            return  # admitted before the last trip; it mustn't restart the cooldown
+        self.outcomes.append(success)
+
+        if success or len(self.outcomes) < self.min_calls:
+            return
+
+        # Trip on a high error rate across the window, or on a burst of back-to-back failures
+        burst = list(self.outcomes)[-self.min_calls:]
+        if self.error_rate() >= self.failure_ratio or not any(burst):
+            self._open()
+
+    def _open(self):
+        self.state = "open"
+        self.generation += 1
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        print(f"🔌 Translation circuit opened (error rate {self.error_rate():.0%}).")
+
+    def error_rate(self):
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+class TranslationService:
+    """
+    Wraps the configured TranslationBackend and runs its blocking calls on a
+    bounded worker pool, so a slow round trip never stalls the event loop.
+    Results are served from the two-tier TranslationCache whenever possible.
+
+    Backend calls get a deadline, an optional hedged second attempt once the
+    first is slower than the recent p95, and a circuit breaker.
+    """
+
+    HEDGE_MIN_SAMPLES = 20
+    HEDGE_MIN_DELAY = 0.25
+    HEDGE_WORKERS = 2
+
+    def __init__(self, backend, cache, max_workers=TRANSLATION_WORKERS):
+        self.backend = backend
+        self.cache = cache
+        self.backend_requests = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.hedged = 0
+        self.skipped_locally = 0
+        self.latencies = deque(maxlen=200)
+        self.inflight = {}  # cache key -> future shared by identical concurrent requests
+        self.breaker = CircuitBreaker(
+            window=TRANSLATION_BREAKER_WINDOW,
+            failure_ratio=TRANSLATION_BREAKER_FAILURE_RATIO,
+            min_calls=TRANSLATION_BREAKER_MIN_CALLS,
+            cooldown=TRANSLATION_BREAKER_COOLDOWN
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="whisperling-translate"
+        )
+        # Hedges get their own threads so they don't queue behind the stalled calls they're meant to beat
+        self.hedge_executor = ThreadPoolExecutor(
+            max_workers=self.HEDGE_WORKERS,
+            thread_name_prefix="whisperling-hedge"
+        )
+        self.hedges_running = 0
+        # Cache I/O gets its own thread so it never waits behind backend calls stuck on the main pool
+        self.cache_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="whisperling-cache"
+        )
+
+    def _run(self, fn, *args):
+        return asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def _cache_io(self, fn, *args):
+        return asyncio.get_running_loop().run_in_executor(self.cache_executor, fn, *args)
+
+    async def _cache_io_until(self, deadline, fn, *args):
+        remaining = deadline - asyncio.get_running_loop().time()
+        try:
+            return await asyncio.wait_for(self._cache_io(fn, *args), max(remaining, 0))
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise TranslationUnavailable(f"translation timed out after {TRANSLATION_TIMEOUT}s") from None
+
+    def _admit(self):
+        ticket = self.breaker.allow()
+        if ticket is None:
+            raise TranslationUnavailable("translation circuit is open")
+        return ticket
+
+    def hedge_delay(self):
+        if not TRANSLATION_HEDGING or len(self.latencies) < self.HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        p95 = ordered[int(len(ordered) * 0.95) - 1]
+        return max(p95, self.HEDGE_MIN_DELAY)
+
+    async def _call_backend(self, fn, *args):
+        ticket = self._admit()
+        try:
+            deadline = asyncio.get_running_loop().time() + TRANSLATION_TIMEOUT
+            return await self._attempt_backend(ticket, deadline, fn, *args)
+        finally:
+            self.breaker.finish(ticket)
+
+    def _hedge_done(self, _):
+        self.hedges_running -= 1
+
+    async def _attempt_backend(self, ticket, deadline, fn, *args):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        attempts = set()
+
+        def _attempt(executor):
+            # Counted here on the event loop before dispatch, never from a worker thread
+            self.backend_requests += 1
+            future = loop.run_in_executor(executor, fn, *args)
+            # Abandoned attempts still finish in their thread; don't warn about their errors
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            attempts.add(future)
+            return future
+
+        _attempt(self.executor)
+        delay = self.hedge_delay()
+        if delay is not None and started + delay < deadline:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            # Skip the hedge if earlier hedges are still stuck; queueing behind them wouldn't help
+            if not done and self.hedges_running < self.HEDGE_WORKERS:
+                self.hedged += 1
+                self.hedges_running += 1
+                _attempt(self.hedge_executor).add_done_callback(self._hedge_done)
+
+        error = None
+        pending = attempts
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=max(deadline - loop.time(), 0), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                self.timeouts += 1
+                self.breaker.record(ticket, False)
+                raise TranslationUnavailable(f"translation timed out after {TRANSLATION_TIMEOUT}s")
+
+            for future in done:
+                if future.exception() is None:
+                    self.latencies.append(loop.time() - started)
+                    self.breaker.record(ticket, True)
+                    return future.result()
+                error = future.exception()
+
+        self.failures += 1
+        self.breaker.record(ticket, False)
+        raise TranslationUnavailable(str(error)) from error
+
+    # An open circuit fails fast before any executor hop, and one deadline covers the disk lookup and the backend
+
+    async def _resolve(self, key, text):
+        deadline = asyncio.get_running_loop().time() + TRANSLATION_TIMEOUT
+        ticket = self._admit()
+        try:
+            cached = await self._cache_io_until(deadline, self.cache.get_disk, key)
+            if cached is not None:
+                return cached
+
+            _, src, dest = key
+            translated = await self._attempt_backend(ticket, deadline, self.backend.translate, text, dest, src)
+        finally:
+            self.breaker.finish(ticket)
+
+        await self._cache_io(self.cache.put, key, translated)
+        return translated
+
+    async def _resolve_many(self, keys, texts):
+        deadline = asyncio.get_running_loop().time() + TRANSLATION_TIMEOUT
+        ticket = self._admit()
+        try:
+            results = await self._cache_io_until(deadline, lambda: [self.cache.get_disk(key) for key in keys])
+            missing = [i for i, cached in enumerate(results) if cached is None]
+            translated = []
+            if missing:
+                _, src, dest = keys[0]
+                translated = await self._attempt_backend(
+                    ticket, deadline, self.backend.translate_batch, [texts[i] for i in missing], dest, src
+                )
+        finally:
+            self.breaker.finish(ticket)
+
+        for i, value in zip(missing, translated):
+            await self._cache_io(self.cache.put, keys[i], value)
+            results[i] = value
+        return results
+
+    async def translate(self, text: str, dest: str, src: str = "auto") -> str:
+        key = (normalize_translation_text(text), src, dest)
+        cached = self.cache.get_memory(key)
+        if cached is not None:
+            return cached
+
+        # 🪢 Share one in-flight lookup between identical concurrent requests
+        future = self.inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._resolve(key, text))
+        self._register_inflight(key, future)
+        return await asyncio.shield(future)
+
+    def _register_inflight(self, key, future):
+        self.inflight[key] = future
+        future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        # Coalesced waiters may all be gone; don't warn about an error nobody awaited
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    @staticmethod
+    async def _batch_item(batch, index):
+        return (await asyncio.shield(batch))[index]
+
+    async def translate_batch(self, texts, dest: str, src: str = "auto"):
+        """
+        Translate several strings into one language, keeping their order.
+        Backends with a native batch call resolve all misses in one round
+        trip; otherwise the strings are translated concurrently.
+        """
+        unique = list(dict.fromkeys(texts))
+        translated = {}
+
+        if self.backend.native_batch:
+            keys = {text: (normalize_translation_text(text), src, dest) for text in unique}
+            for text in unique:
+                cached = self.cache.get_memory(keys[text])
+                if cached is not None:
+                    translated[text] = cached
+
+            missing = [text for text in unique if text not in translated and keys[text] not in self.inflight]
+            if len(missing) > 1:
+                batch = asyncio.ensure_future(self._resolve_many([keys[text] for text in missing], missing))
+                # Register every key so single translate() calls join this round trip instead of repeating it
+                for index, text in enumerate(missing):
+                    self._register_inflight(keys[text], asyncio.ensure_future(self._batch_item(batch, index)))
+                results = await asyncio.shield(batch)
+                translated.update(zip(missing, results))
+
+        remaining = [text for text in unique if text not in translated]
+        results = await asyncio.gather(*(self.translate(text, dest, src) for text in remaining))
+        translated.update(zip(remaining, results))
+        return [translated[text] for text in texts]
+
+    async def translate_message(self, message_id, content: str, dest: str) -> str:
+        """
+        Translate a Discord message for one reader. Messages that are already
+        in the reader's language, or carry no words at all, skip the backend.
+        """
+        detected = detect_message_language(message_id, content)
+        if detected == NO_LINGUISTIC_CONTENT or (detected and same_language(detected, dest)):
+            self.skipped_locally += 1
+            return content
+        return await self.translate(content, dest)
+
+    async def detect(self, text: str) -> str:
+        return await self._call_backend(self.backend.detect, text)
+
+    async def stats(self):
+        # The cache's disk COUNT is blocking, so it runs on the cache thread like every other disk access
+        stats = await self._cache_io(self.cache.stats)
+        stats["backend"] = self.backend.name
+        stats["backend_requests"] = self.backend_requests
+        stats["coalesced"] = self.coalesced
+        stats["inflight"] = len(self.inflight)
+        stats["timeouts"] = self.timeouts
+        stats["failures"] = self.failures
+        stats["hedged"] = self.hedged
+        stats["skipped_locally"] = self.skipped_locally
+        stats["breaker_state"] = self.breaker.state
+        stats["breaker_opened"] = self.breaker.times_opened
+        stats["breaker_rejected"] = self.breaker.rejected
+        stats["error_rate"] = self.breaker.error_rate()
+        return stats
+
+translation_cache = TranslationCache(
+    TRANSLATION_CACHE_FILE,
+    memory_size=TRANSLATION_CACHE_MEMORY_SIZE,
+    disk_size=TRANSLATION_CACHE_DISK_SIZE,
+    ttl=TRANSLATION_CACHE_TTL
+)
+translation_service = TranslationService(build_translation_backend(), translation_cache)
+
+# ========== LANGUAGE DETECTION ==========
+NO_LINGUISTIC_CONTENT = "zxx"  # ISO 639 code for "nothing to translate"
+DETECTION_CACHE_SIZE = 5000
+
+NON_LINGUISTIC_PATTERN = re.compile(
+    r"https?://\S+"              # links
+    r"|<a?:\w+:\d+>"             # custom emoji
+    r"|<(?:@[!&]?|#)\d+>"         # user, role and channel mentions
+    r"|<t:\d+(?::\w)?>"           # timestamps
+    r"|@everyone|@here"
+    r"|`[^`]*`"                   # inline code
+)
+
+# Scripts used by exactly one language we can safely trust without a backend
+UNIQUE_SCRIPT_LANGUAGES = {
+    "hangul": "ko",
+    "kana": "ja",
+    "greek": "el",
+    "hebrew": "he",
+    "thai": "th",
+}
+
+STOPWORDS = {
+    "en": {"the", "and", "is", "are", "you", "to", "of", "it", "that", "this", "what", "have", "i", "in", "for", "with", "not", "be", "was", "my"},
+    "de": {"der", "die", "das", "und", "ist", "nicht", "ich", "du", "sie", "ein", "eine", "mit", "auf", "zu", "es", "wir", "auch", "was", "wie", "bin"},
+    "fr": {"le", "la", "les", "et", "est", "je", "tu", "vous", "nous", "un", "une", "des", "pas", "que", "qui", "dans", "pour", "sur", "avec", "ce"},
+    "es": {"el", "la", "los", "las", "y", "es", "yo", "tú", "que", "de", "un", "una", "no", "por", "para", "con", "está", "pero", "muy", "como"},
+    "it": {"il", "lo", "la", "gli", "e", "è", "io", "tu", "che", "di", "un", "una", "non", "per", "con", "sono", "ma", "come", "anche", "questo"},
+    "nl": {"de", "het", "een", "en", "is", "ik", "je", "niet", "van", "dat", "op", "te", "zijn", "met", "voor", "maar", "ook", "wat", "hoe", "er"},
+    "pt": {"o", "os", "as", "e", "é", "eu", "você", "que", "de", "um", "uma", "não", "por", "para", "com", "está", "mas", "muito", "como", "isso"},
+    "pl": {"i", "w", "nie", "to", "jest", "się", "na", "z", "że", "co", "jak", "ale", "ja", "ty", "tak", "do", "czy", "mam", "jestem", "już"},
+    "tr": {"ve", "bir", "bu", "da", "de", "ne", "ben", "sen", "değil", "için", "çok", "ama", "gibi", "var", "yok", "mi", "mı", "ile", "evet", "hayır"},
+}
+
+WORD_PATTERN = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+# (message id, content hash) -> detected language (or NO_LINGUISTIC_CONTENT / None when unsure)
+detected_language_by_message = OrderedDict()
+
+def char_script(ch):
+    code = ord(ch)
+    if 0xAC00 <= code <= 0xD7AF or 0x1100 <= code <= 0x11FF:
+        return "hangul"
+    if 0x3040 <= code <= 0x30FF:
+        return "kana"
+    if 0x4E00 <= code <= 0x9FFF:
+        return "han"
+    if 0x0370 <= code <= 0x03FF:
+        return "greek"
+    if 0x0400 <= code <= 0x04FF:
+        return "cyrillic"
+    if 0x0590 <= code <= 0x05FF:
+        return "hebrew"
+    if 0x0600 <= code <= 0x06FF:
+        return "arabic"
+    if 0x0E00 <= code <= 0x0E7F:
+        return "thai"
+    if 0x0900 <= code <= 0x097F:
+        return "devanagari"
+    if ch.isalpha():
+        return "latin"
+    return None
+
+def detect_local_language(text: str):
+    """
+    Cheap local guess at a message's language.
+    Returns NO_LINGUISTIC_CONTENT for emoji/links/mentions only, a language
+    code when confident, or None when the backend should decide.
+    """
+    stripped = NON_LINGUISTIC_PATTERN.sub(" ", text)
+    letters = [ch for ch in stripped if ch.isalpha()]
+    if not letters:
+        return NO_LINGUISTIC_CONTENT
+
+    scripts = defaultdict(int)
+    for ch in letters:
+        script = char_script(ch)
+        if script:
+            scripts[script] += 1
+    dominant, count = max(scripts.items(), key=lambda item: item[1])
+
+    # Japanese mixes kana with kanji, so judge the two together
+    if scripts.get("kana") and (scripts["kana"] + scripts.get("han", 0)) / len(letters) >= 0.8:
+        return "ja"
+    if count / len(letters) < 0.8:
+        return None
+    if dominant in UNIQUE_SCRIPT_LANGUAGES:
+        return UNIQUE_SCRIPT_LANGUAGES[dominant]
+    if dominant != "latin":
+        return None
+
+    words = [word.lower() for word in WORD_PATTERN.findall(stripped)]
+    scores = sorted(
+        ((sum(word in stopwords for word in words), lang) for lang, stopwords in STOPWORDS.items()),
+        reverse=True
+    )
+    (best_score, best_lang), (runner_up, _) = scores[0], scores[1]
+
+    # Need a couple of hits and a clear winner before trusting it
+    if best_score >= 2 and best_score >= 2 * runner_up:
+        return best_lang
+    return None
+
+def detect_message_language(message_id, text: str):
+    # Keyed by content too, so an edited message is detected afresh
+    key = (message_id, hash(text))
+    if key in detected_language_by_message:
+        detected_language_by_message.move_to_end(key)
+        return detected_language_by_message[key]
+
+    detected = detect_local_language(text)
+    detected_language_by_message[key] = detected
+    while len(detected_language_by_message) > DETECTION_CACHE_SIZE:
+        detected_language_by_message.popitem(last=False)
+    return detected
+
+def same_language(a: str, b: str) -> bool:
+    aliases = {"iw": "he", "jw": "jv"}
+    a = aliases.get(a, a.lower().split("-")[0])
+    b = aliases.get(b, b.lower().split("-")[0])
+    return a == b
+
 # ========== LANGUAGE FILE HANDLING ==========
-if os.path.exists(LANGUAGE_FILE):
-    with open(LANGUAGE_FILE, "r", encoding="utf-8") as f:
-        all_languages = json.load(f)
+try:
+    import orjson  # optional, much faster than the stdlib encoder
+except ImportError:
+    orjson = None
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping
+import weakref
+import shutil
+
+LANGUAGE_SAVE_DEBOUNCE = float(os.getenv("WHISPERLING_SAVE_DEBOUNCE", "2"))
+LANGUAGE_JOURNAL_COMPACT_BYTES = int(os.getenv("WHISPERLING_JOURNAL_COMPACT_BYTES", str(1024 * 1024)))
+GUILD_SHARD_DIR = os.getenv("WHISPERLING_SHARD_DIR", "guild_configs")
+GUILD_CACHE_SIZE = int(os.getenv("WHISPERLING_GUILD_CACHE_SIZE", "256"))
+
+def _encode_default(obj):
+    if isinstance(obj, UserLanguageIndex):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def encode_languages(data) -> bytes:
+    # Compact output: the stdlib only uses its C encoder when indent is None
+    if orjson is not None:
+        return orjson.dumps(data, default=_encode_default)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_encode_default).encode("utf-8")
+
+def snapshot_guild_config(config):
+    """
+    Detached copy of a guild config, taken on the event loop before a worker
+    thread encodes it. The live member index can't be read from a thread: a
+    pick inserts into its two arrays one after the other.
+    """
+    if config is None:
+        return None
+    return {
+        key: value.copy() if isinstance(value, UserLanguageIndex) else copy.deepcopy(value)
+        for key, value in config.items()
+    }
+
+def write_file_atomically(path, payload: bytes):
+    """Write to a temp file, fsync it, then rename over the target so a crash never leaves half a file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def read_journal(path):
+    """Yield (guild_id, user_id, lang) records from a language journal, skipping a torn final line."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            yield record["g"], record["u"], record["l"]
+
+# 🔤 Interned language code table shared by every guild's member index
+LANGUAGE_CODES = []
+LANGUAGE_CODE_IDS = {}
+
+def intern_language_code(code):
+    code_id = LANGUAGE_CODE_IDS.get(code)
+    if code_id is None:
+        code_id = len(LANGUAGE_CODES)
+        LANGUAGE_CODES.append(code)
+        LANGUAGE_CODE_IDS[code] = code_id
+    return code_id
+
+class UserLanguageIndex(MutableMapping):
+    """
+    Member language picks for one guild, stored as a sorted array of integer
+    user ids beside a parallel array of interned language code ids: about
+    10 bytes a member instead of a dict entry and two strings. Lookups are a
+    binary search. Keys are still str user ids so it stands in for the old
+    {"user_id": "lang"} dict.
+
+    It also keeps a running member count per language, updated on every
+    assignment, so "which languages have readers here" never needs a scan.
+    """
+    __slots__ = ("ids", "codes", "counts")
+
+    def __init__(self, mapping=None):
+        pairs = sorted((int(user_id), intern_language_code(lang)) for user_id, lang in (mapping or {}).items())
+        self.ids = array("Q", [user_id for user_id, _ in pairs])
+        self.codes = array("H", [code_id for _, code_id in pairs])
+        self.counts = defaultdict(int)  # code id -> members using it
+        for code_id in self.codes:
+            self.counts[code_id] += 1
+
+    def _count(self, code_id, delta):
+        self.counts[code_id] += delta
+        if not self.counts[code_id]:
+            del self.counts[code_id]
+
+    def _find(self, user_id):
+        """Return (int id, position, found) for a str or int user id."""
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return None, 0, False
+        pos = bisect_left(self.ids, user_id)
+        return user_id, pos, pos < len(self.ids) and self.ids[pos] == user_id
+
+    def __getitem__(self, user_id):
+        _, pos, found = self._find(user_id)
+        if not found:
+            raise KeyError(user_id)
+        return LANGUAGE_CODES[self.codes[pos]]
+
+    def __setitem__(self, user_id, lang):
+        key, pos, found = self._find(user_id)
+        if key is None:
+            raise KeyError(user_id)
+        code_id = intern_language_code(lang)
+        if found:
+            self._count(self.codes[pos], -1)
+            self.codes[pos] = code_id
+        else:
+            self.ids.insert(pos, key)
+            self.codes.insert(pos, code_id)
+        self._count(code_id, 1)
+
+    def __delitem__(self, user_id):
+        _, pos, found = self._find(user_id)
+        if not found:
+            raise KeyError(user_id)
+        self._count(self.codes[pos], -1)
+        del self.ids[pos]
+        del self.codes[pos]
+
+    def get(self, user_id, default=None):
+        _, pos, found = self._find(user_id)
+        return LANGUAGE_CODES[self.codes[pos]] if found else default
+
+    def __contains__(self, user_id):
+        return self._find(user_id)[2]
+
+    def __iter__(self):
+        return (str(user_id) for user_id in self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def items(self):
+        return [(str(user_id), LANGUAGE_CODES[code_id]) for user_id, code_id in zip(self.ids, self.codes)]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def copy(self):
+        # Array slices copy in C, so this is cheap enough for the event loop
+        clone = UserLanguageIndex.__new__(UserLanguageIndex)
+        clone.ids = self.ids[:]
+        clone.codes = self.codes[:]
+        clone.counts = defaultdict(int, self.counts)
+        return clone
+
+    def usage(self):
+        """Members per language code, most used first."""
+        return dict(sorted(
+            ((LANGUAGE_CODES[code_id], count) for code_id, count in self.counts.items()),
+            key=lambda item: -item[1]
+        ))
+
+    def __repr__(self):
+        return f"UserLanguageIndex({len(self)} members)"
+
+class GuildConfig(dict):
+    """
+    A guild's config dict, weak-referenceable so the shard cache can find
+    copies still in use. Its "users" entry is always a UserLanguageIndex.
+    """
+    __slots__ = ("__weakref__",)
+
+    def __init__(self, data=()):
+        super().__init__(data)
+        if "users" in self:
+            self["users"] = self["users"]
+
+    def __setitem__(self, key, value):
+        if key == "users" and not isinstance(value, UserLanguageIndex):
+            value = UserLanguageIndex(value)
+        super().__setitem__(key, value)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+class GuildConfigShards(MutableMapping):
+    """
+    Lazily loaded stand-in for all_languages["guilds"]. A guild's config is
+    read from storage on first access and kept in a bounded LRU; only guilds
+    marked dirty are written back. Dirty and pinned guilds are never evicted,
+    and a config still referenced elsewhere (an open welcome view, say)
+    stays the canonical copy until it is released.
+    """
+
+    def __init__(self, loader, guild_ids, cache_size):
+        self.loader = loader
+        self.known = set(guild_ids)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.live = weakref.WeakValueDictionary()
+        self.dirty = set()
+        self.pinned = set()  # changed outside the shard files (e.g. journaled), so must stay resident
+        self.loads = 0
+
+    def _remember(self, guild_id, config):
+        self.cache[guild_id] = config
+        self.cache.move_to_end(guild_id)
+        self.live[guild_id] = config
+
+        for candidate in list(self.cache)[:-1]:
+            if len(self.cache) <= self.cache_size:
+                break
+            if candidate not in self.dirty and candidate not in self.pinned:
+                del self.cache[candidate]
+
+    def __getitem__(self, guild_id):
+        config = self.cache.get(guild_id)
+        if config is not None:
+            self.cache.move_to_end(guild_id)
+            return config
+
+        config = self.live.get(guild_id)
+        if config is None:
+            if guild_id not in self.known:
+                raise KeyError(guild_id)
+            data = self.loader(guild_id)
+            if data is None:
+                self.known.discard(guild_id)
+                raise KeyError(guild_id)
+            config = GuildConfig(data)
+            self.loads += 1
+
+        self._remember(guild_id, config)
+        return config
+
+    def __setitem__(self, guild_id, config):
+        if not isinstance(config, GuildConfig):
+            config = GuildConfig(config)
+        self.known.add(guild_id)
+        self.dirty.add(guild_id)
+        self._remember(guild_id, config)
+
+    def __delitem__(self, guild_id):
+        if guild_id not in self.known:
+            raise KeyError(guild_id)
+        self.known.discard(guild_id)
+        self.cache.pop(guild_id, None)
+        self.live.pop(guild_id, None)
+        self.dirty.add(guild_id)  # written back as a deletion
+
+    def __contains__(self, guild_id):
+        return guild_id in self.known
+
+    def __iter__(self):
+        return iter(list(self.known))
+
+    def __len__(self):
+        return len(self.known)
+
+    def setdefault(self, guild_id, default=None):
+        # Return the stored config, not the caller's default dict
+        if guild_id not in self.known:
+            self[guild_id] = {} if default is None else default
+        return self[guild_id]
+
+    def mark_dirty(self, guild_id):
+        if guild_id in self.known:
+            self.dirty.add(guild_id)
+
+    def reload(self, guild_ids):
+        """
+        Start over from storage after a restore. Configs still referenced
+        elsewhere are refreshed in place, so their holders see the restored
+        data instead of writing to a copy nothing reads any more.
+        """
+        live = dict(self.live)
+        self.known = set(guild_ids)
+        self.cache = OrderedDict()
+        self.live = weakref.WeakValueDictionary()
+        self.dirty = set()
+        self.pinned = set()
+
+        for guild_id, config in live.items():
+            data = self.loader(guild_id) if guild_id in self.known else None
+            config.clear()
+            if data is None:
+                continue  # not in the backup: the holder keeps an empty config that is never saved
+            for key, value in data.items():
+                config[key] = value
+            self._remember(guild_id, config)
+
+    def take_dirty(self):
+        """Hand over dirty guilds for writing; None marks a deleted guild."""
+        dirty, self.dirty = self.dirty, set()
+        return {guild_id: self[guild_id] if guild_id in self.known else None for guild_id in dirty}
+
+class LanguagePersistence:
+    """
+    Write-behind persistence for per-guild config shards, one JSON file per
+    guild. Changes only mark a guild dirty; a debounced background task
+    writes just those shards, atomically and off the event loop.
+
+    Member language picks skip even that: each one is appended to a small
+    journal that is replayed at startup and folded back into the shards in
+    the background once it grows past a size threshold.
+    """
+
+    def __init__(self, directory, debounce, journal_limit=LANGUAGE_JOURNAL_COMPACT_BYTES):
+        self.path = directory
+        self.debounce = debounce
+        os.makedirs(directory, exist_ok=True)
+        self.journal_path = os.path.join(directory, "journal.log")
+        self.compacting_path = f"{self.journal_path}.compacting"
+        self.journal_limit = journal_limit
+        self.journal_size = 0
+        self.journaled = set()  # guilds with picks in the live journal
+        self.compacting = set()  # guilds with picks in the rotated journal
+        self.writes = 0
+        self.compactions = 0
+        self.shards = None
+        self._journal_file = None
+        self._task = None
+        self._compaction_task = None
+        self._lock = threading.Lock()
+
+    def shard_path(self, guild_id):
+        return os.path.join(self.path, f"{guild_id}.json")
+
+    def guild_ids(self):
+        return [name[:-len(".json")] for name in os.listdir(self.path) if name.endswith(".json")]
+
+    def load_guild(self, guild_id):
+        # No lock needed on the event loop: shards are only ever swapped in by atomic rename
+        try:
+            with open(self.shard_path(guild_id), "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    # Safe from any thread, e.g. the backup writer: a whole flush or restore lands before or after the read
+
+    def read_guild_ids(self):
+        with self._lock:
+            return self.guild_ids()
+
+    def read_guild(self, guild_id):
+        with self._lock:
+            return self.load_guild(guild_id)
+
+    def open(self):
+        self.shards = GuildConfigShards(self.load_guild, self.guild_ids(), GUILD_CACHE_SIZE)
+        return self.shards
+
+    @staticmethod
+    def migrate_from_json(directory, data):
+        """
+        One-shot split of a legacy single-file languages.json into per-guild
+        shards. The shards are staged in a sibling directory that is renamed
+        into place only once every guild is written, so a crash mid-split
+        leaves no shard directory and the split runs again on the next start.
+        """
+        staging = f"{directory}.splitting"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        guilds = data.get("guilds", {})
+        for guild_id, config in guilds.items():
+            write_file_atomically(os.path.join(staging, f"{guild_id}.json"), encode_languages(config))
+        os.replace(staging, directory)
+        print(f"🗂️ Split {len(guilds)} guilds from {LANGUAGE_FILE} into {directory}/.")
+
+    def mark_dirty(self, guild_id=None):
+        if guild_id is None:
+            self.shards.dirty.update(self.shards.cache)
+        else:
+            self.shards.mark_dirty(str(guild_id))
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (startup or shutdown): write straight away
+            self.flush_now()
+            return
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._flush_later())
+
+    # --- Member language journal ---
+
+    def replay_journal(self):
+        """Apply journaled picks (an interrupted compaction first) on top of the shards."""
+        replayed = 0
+        for path, guilds in ((self.compacting_path, self.compacting), (self.journal_path, self.journaled)):
+            for guild_id, user_id, lang in read_journal(path):
+                self.shards.setdefault(guild_id, {}).setdefault("users", {})[user_id] = lang
+                self.shards.pinned.add(guild_id)
+                guilds.add(guild_id)
+                replayed += 1
+
+        if replayed:
+            print(f"📜 Replayed {replayed} journaled language picks.")
+        self.journal_size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+
+    def record_user_language(self, guild_id, user_id, lang):
+        line = json.dumps({"g": guild_id, "u": user_id, "l": lang}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        try:
+            if self._journal_file is None:
+                self._journal_file = open(self.journal_path, "a", encoding="utf-8")
+            self._journal_file.write(line)
+            self._journal_file.flush()
+        except OSError as e:
+            print(f"❗ Failed to journal language pick, saving the shard instead: {e}")
+            self.mark_dirty(guild_id)
+            return
+
+        self.journaled.add(guild_id)
+        self.shards.pinned.add(guild_id)
+        self.journal_size += len(line.encode("utf-8"))
+        if self.journal_size >= self.journal_limit:
+            self._schedule_compaction()
+
+    def _rotate_journal(self):
+        # Every journaled pick is already in memory, so shards written after this cover the rotated file
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        if os.path.exists(self.journal_path) and not os.path.exists(self.compacting_path):
+            os.replace(self.journal_path, self.compacting_path)
+            self.compacting |= self.journaled
+            self.journaled = set()
+            self.journal_size = 0
+
+    def _schedule_compaction(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.compact_now()
+            return
+        if self._compaction_task is None or self._compaction_task.done():
+            self._compaction_task = loop.create_task(self.compact())
+
+    def _compaction_batch(self):
+        configs = self.shards.take_dirty()
+        for guild_id in self.compacting:
+            configs.setdefault(guild_id, self.shards.get(guild_id))
+        return {guild_id: snapshot_guild_config(config) for guild_id, config in configs.items()}
+
+    def _finish_compaction(self, failed):
+        for guild_id in failed:
+            self.shards.dirty.add(guild_id)
+        if failed:
+            return
+        if os.path.exists(self.compacting_path):
+            os.remove(self.compacting_path)
+        for guild_id in self.compacting - self.journaled:
+            self.shards.pinned.discard(guild_id)
+        self.compacting = set()
+        self.compactions += 1
+
+    async def compact(self):
+        self._rotate_journal()
+        if not self.compacting:
+            return
+        loop = asyncio.get_running_loop()
+        failed = await loop.run_in_executor(None, self._write_shards, self._compaction_batch())
+        self._finish_compaction(failed)
+
+    def compact_now(self):
+        self._rotate_journal()
+        if self.compacting:
+            self._finish_compaction(self._write_shards(self._compaction_batch()))
+
+    async def checkpoint(self):
+        """Fold the journal and any pending changes into the shards (e.g. before a backup)."""
+        await self.compact()
+        await self.flush()
+
+    # --- Shard files ---
+
+    async def _flush_later(self):
+        while self.shards.dirty:
+            await asyncio.sleep(self.debounce)
+            await self.flush()
+
+    async def flush(self):
+        configs = {guild_id: snapshot_guild_config(config) for guild_id, config in self.shards.take_dirty().items()}
+        if not configs:
+            return
+        loop = asyncio.get_running_loop()
+        failed = await loop.run_in_executor(None, self._write_shards, configs)
+        self.shards.dirty.update(failed)
+
+    def flush_now(self):
+        self.shards.dirty.update(self._write_shards(self.shards.take_dirty()))
+
+    def _write_shards(self, configs):
+        """Blocking: write (or delete) each changed guild's shard from its snapshot. Returns the guild ids that failed."""
+        failed = []
+        with self._lock:
+            for guild_id, config in configs.items():
+                try:
+                    if config is None:
+                        if os.path.exists(self.shard_path(guild_id)):
+                            os.remove(self.shard_path(guild_id))
+                    else:
+                        write_file_atomically(self.shard_path(guild_id), encode_languages(config))
+                except Exception as e:
+                    failed.append(guild_id)
+                    print(f"❗ Failed to save shard for guild {guild_id}: {e}")
+            if configs:
+                self.writes += 1
+        return failed
+
+    # --- Restore ---
+
+    async def restore(self, configs):
+        """Replace every shard with the given configs and reload the shard map in place."""
+        await self.checkpoint()
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._replace_shards, configs)
+        self.journaled = set()
+        self.compacting = set()
+        self.journal_size = 0
+        self.shards.reload(self.guild_ids())
+        return self.shards
+
+    def _replace_shards(self, configs):
+        with self._lock:
+            for guild_id in set(self.guild_ids()) - set(configs):
+                os.remove(self.shard_path(guild_id))
+            for guild_id, config in configs.items():
+                write_file_atomically(self.shard_path(guild_id), encode_languages(config))
+            for path in (self.journal_path, self.compacting_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+class SqliteLanguageStore:
+    """
+    Optional SQLite storage for guild configs and member language choices.
+    A member's language pick is a single-row upsert; admin edits rewrite only
+    that guild's small config tables. Writes are debounced like the JSON store.
+    """
+
+    def __init__(self, path, debounce):
+        self.path = path
+        self.debounce = debounce
+        self.pending_users = {}  # (guild_id, user_id) -> language code
+        self.writes = 0
+        self.shards = None
+        self._task = None
+        self._lock = threading.Lock()
+
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS guilds (
+                guild_id TEXT PRIMARY KEY,
+                welcome_channel_id INTEGER,
+                whispers_enabled INTEGER,
+                extra TEXT NOT NULL DEFAULT '{}'
+            );
+            CREATE TABLE IF NOT EXISTS languages (
+                guild_id TEXT NOT NULL,
+                code TEXT NOT NULL,
+                name TEXT NOT NULL,
+                welcome TEXT,
+                PRIMARY KEY (guild_id, code)
+            );
+            CREATE TABLE IF NOT EXISTS users (
+                guild_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                PRIMARY KEY (guild_id, user_id)
+            );
+            CREATE TABLE IF NOT EXISTS rules (
+                guild_id TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                text TEXT NOT NULL,
+                PRIMARY KEY (guild_id, lang)
+            );
+            CREATE TABLE IF NOT EXISTS role_options (
+                guild_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                role_id TEXT NOT NULL,
+                emoji TEXT,
+                label TEXT,
+                PRIMARY KEY (guild_id, kind, role_id)
+            );
+            """
+        )
+        self.db.commit()
+        self.reader = sqlite3.connect(path, check_same_thread=False)
+        self._read_lock = threading.Lock()
+
+    ROLE_KINDS = {"role": "role_options", "cosmetic": "cosmetic_role_options"}
+    CORE_KEYS = {"welcome_channel_id", "whispers_enabled", "languages", "users", "rules", *ROLE_KINDS.values()}
+
+    def is_empty(self):
+        return self.db.execute("SELECT 1 FROM guilds LIMIT 1").fetchone() is None
+
+    # Reads use their own connection. In WAL mode they see the last commit and never wait on a flush,
+    # so loading a guild on the event loop doesn't stall behind the writer's lock.
+
+    def guild_ids(self):
+        with self._read_lock:
+            return [row[0] for row in self.reader.execute("SELECT guild_id FROM guilds UNION SELECT guild_id FROM users")]
+
+    def load_guild(self, guild_id):
+        with self._read_lock:
+            # One read transaction, so a commit can't land between the guild's tables
+            self.reader.execute("BEGIN")
+            try:
+                return self._read_guild(guild_id)
+            finally:
+                self.reader.rollback()
+
+    # Safe from any thread, e.g. the backup writer
+    read_guild_ids = guild_ids
+    read_guild = load_guild
+
+    def _read_guild(self, guild_id):
+        # Caller holds self._read_lock
+        row = self.reader.execute(
+            "SELECT welcome_channel_id, whispers_enabled, extra FROM guilds WHERE guild_id = ?", (guild_id,)
+        ).fetchone()
+        users = dict(self.reader.execute("SELECT user_id, lang FROM users WHERE guild_id = ?", (guild_id,)))
+        if row is None and not users:
+            return None
+
+        config = {}
+        if row is not None:
+            channel_id, whispers, extra = row
+            config.update(json.loads(extra))
+            if channel_id is not None:
+                config["welcome_channel_id"] = channel_id
+            if whispers is not None:
+                config["whispers_enabled"] = bool(whispers)
+
+        config["languages"] = {}
+        for code, name, welcome in self.reader.execute(
+            "SELECT code, name, welcome FROM languages WHERE guild_id = ?", (guild_id,)
+        ):
+            config["languages"][code] = {"name": name} if welcome is None else {"name": name, "welcome": welcome}
+        config["users"] = users
+
+        rules = dict(self.reader.execute("SELECT lang, text FROM rules WHERE guild_id = ?", (guild_id,)))
+        if rules:
+            config["rules"] = rules
+        for kind, role_id, emoji, label in self.reader.execute(
+            "SELECT kind, role_id, emoji, label FROM role_options WHERE guild_id = ?", (guild_id,)
+        ):
+            config.setdefault(self.ROLE_KINDS[kind], {})[role_id] = {"emoji": emoji, "label": label}
+        return config
+
+    def open(self):
+        self.shards = GuildConfigShards(self.load_guild, self.guild_ids(), GUILD_CACHE_SIZE)
+        return self.shards
+
+    def migrate_from_json(self, data, source=LANGUAGE_FILE):
+        """One-shot import of existing JSON guild configs (languages.json or its shards) into empty tables."""
+        guilds = data.get("guilds", {})
+        with self._lock:
+            self._import_guilds(guilds)
+            self.db.commit()
+        print(f"🗃️ Migrated {len(guilds)} guilds from {source} into {self.path}.")
+
+    def _import_guilds(self, guilds):
+        # Caller holds self._lock and commits
+        for guild_id, config in guilds.items():
+            self._write_guild(guild_id, config)
+        self.db.executemany(
+            "INSERT OR REPLACE INTO users (guild_id, user_id, lang) VALUES (?, ?, ?)",
+            [
+                (guild_id, user_id, lang)
+                for guild_id, config in guilds.items()
+                for user_id, lang in config.get("users", {}).items()
+            ]
+        )
+
+    def _write_guild(self, guild_id, config):
+        # Caller holds self._lock; config is a snapshot taken on the event loop, None for a deleted guild
+        if config is None:
+            for table in ("guilds", "languages", "users", "rules", "role_options"):
+                self.db.execute(f"DELETE FROM {table} WHERE guild_id = ?", (guild_id,))
+            return
+
+        extra = {key: value for key, value in config.items() if key not in self.CORE_KEYS}
+        whispers = config.get("whispers_enabled")
+        self.db.execute(
+            "INSERT OR REPLACE INTO guilds (guild_id, welcome_channel_id, whispers_enabled, extra) VALUES (?, ?, ?, ?)",
+            (guild_id, config.get("welcome_channel_id"), None if whispers is None else int(whispers), json.dumps(extra))
+        )
+        for table in ("languages", "rules", "role_options"):
+            self.db.execute(f"DELETE FROM {table} WHERE guild_id = ?", (guild_id,))
+        self.db.executemany(
+            "INSERT INTO languages (guild_id, code, name, welcome) VALUES (?, ?, ?, ?)",
+            [(guild_id, code, data.get("name", code), data.get("welcome")) for code, data in config.get("languages", {}).items()]
+        )
+        self.db.executemany(
+            "INSERT INTO rules (guild_id, lang, text) VALUES (?, ?, ?)",
+            [(guild_id, lang, text) for lang, text in config.get("rules", {}).items()]
+        )
+        self.db.executemany(
+            "INSERT INTO role_options (guild_id, kind, role_id, emoji, label) VALUES (?, ?, ?, ?, ?)",
+            [
+                (guild_id, kind, role_id, data.get("emoji"), data.get("label"))
+                for kind, key in self.ROLE_KINDS.items()
+                for role_id, data in config.get(key, {}).items()
+            ]
+        )
+
+    def mark_dirty(self, guild_id=None):
+        if guild_id is None:
+            self.shards.dirty.update(self.shards.cache)
+        else:
+            self.shards.mark_dirty(str(guild_id))
+        self._schedule()
+
+    def record_user_language(self, guild_id, user_id, lang):
+        self.pending_users[(str(guild_id), str(user_id))] = lang
+        self.shards.pinned.add(str(guild_id))  # keep resident until the upsert lands
+        self._schedule()
+
+    def _schedule(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_now()
+            return
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._flush_later())
+
+    def _take_pending(self):
+        guilds = {
+            guild_id: None if config is None else copy.deepcopy({k: v for k, v in config.items() if k != "users"})
+            for guild_id, config in self.shards.take_dirty().items()
+        }
+        users = [(guild_id, user_id, lang) for (guild_id, user_id), lang in self.pending_users.items()]
+        self.pending_users = {}
+        return guilds, users
+
+    def _has_pending(self):
+        return bool(self.shards.dirty or self.pending_users)
+
+    async def _flush_later(self):
+        while self._has_pending():
+            await asyncio.sleep(self.debounce)
+            await self.flush()
+
+    async def checkpoint(self):
+        await self.flush()
+
+    async def restore(self, configs):
+        """Replace every table's contents with the given configs and reload the shard map in place."""
+        await self.checkpoint()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._replace_all, configs)
+        self.shards.reload(self.guild_ids())
+        return self.shards
+
+    def _replace_all(self, configs):
+        with self._lock:
+            try:
+                for table in ("guilds", "languages", "users", "rules", "role_options"):
+                    self.db.execute(f"DELETE FROM {table}")
+                self._import_guilds(configs)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+
+    async def flush(self):
+        if not self._has_pending():
+            return
+        guilds, users = self._take_pending()
+        loop = asyncio.get_running_loop()
+        failed = await loop.run_in_executor(None, self._write, guilds, users)
+        self._settle(guilds, users, failed)
+
+    def flush_now(self):
+        if self._has_pending():
+            guilds, users = self._take_pending()
+            self._settle(guilds, users, self._write(guilds, users))
+
+    def _settle(self, guilds, users, failed):
+        if failed:
+            # Put the changes back so the next flush retries them
+            self.shards.dirty.update(guilds)
+            for guild_id, user_id, lang in users:
+                self.pending_users.setdefault((guild_id, user_id), lang)
+            return
+
+        still_pending = {guild_id for guild_id, _ in self.pending_users}
+        for guild_id, _, _ in users:
+            if guild_id not in still_pending:
+                self.shards.pinned.discard(guild_id)
+
+    def _write(self, guilds, users):
+        """Blocking: returns True if the write failed."""
+        with self._lock:
+            try:
+                for guild_id, config in guilds.items():
+                    self._write_guild(guild_id, config)
+                self.db.executemany(
+                    "INSERT INTO users (guild_id, user_id, lang) VALUES (?, ?, ?) "
+                    "ON CONFLICT (guild_id, user_id) DO UPDATE SET lang = excluded.lang",
+                    users
+                )
+                self.db.commit()
+                self.writes += 1
+                return False
+            except Exception as e:
+                self.db.rollback()
+                print(f"❗ Failed to save to {self.path}: {e}")
+                return True
+
+STORAGE_BACKEND = os.getenv("WHISPERLING_STORAGE", "json").lower()
+SQLITE_LANGUAGE_FILE = os.getenv("WHISPERLING_SQLITE_FILE", "whisperling.db")
+
+def load_legacy_languages():
+    """Read the old single-file languages.json, including any picks still in its journal."""
+    data = {"guilds": {}}
+    if os.path.exists(LANGUAGE_FILE):
+        with open(LANGUAGE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    for path in (f"{LANGUAGE_FILE}.journal.compacting", f"{LANGUAGE_FILE}.journal"):
+        for guild_id, user_id, lang in read_journal(path):
+            data["guilds"].setdefault(guild_id, {}).setdefault("users", {})[user_id] = lang
+    return data
+
+def load_shard_languages():
+    """Read every guild shard, including any picks still in the shard journal."""
+    data = {"guilds": {}}
+    for name in os.listdir(GUILD_SHARD_DIR):
+        if name.endswith(".json"):
+            with open(os.path.join(GUILD_SHARD_DIR, name), "r", encoding="utf-8") as f:
+                data["guilds"][name[:-len(".json")]] = json.load(f)
+    journal_path = os.path.join(GUILD_SHARD_DIR, "journal.log")
+    for path in (f"{journal_path}.compacting", journal_path):
+        for guild_id, user_id, lang in read_journal(path):
+            data["guilds"].setdefault(guild_id, {}).setdefault("users", {})[user_id] = lang
+    return data
+
+def retire_legacy_journals():
+    for path in (f"{LANGUAGE_FILE}.journal.compacting", f"{LANGUAGE_FILE}.journal"):
+        if os.path.exists(path):
+            os.remove(path)
+
+if STORAGE_BACKEND == "sqlite":
+    language_store = SqliteLanguageStore(SQLITE_LANGUAGE_FILE, LANGUAGE_SAVE_DEBOUNCE)
+    if language_store.is_empty():
+        # languages.json stops being written once it's split into shards, so the shards win
+        if os.path.isdir(GUILD_SHARD_DIR):
+            language_store.migrate_from_json(load_shard_languages(), GUILD_SHARD_DIR)
+        elif os.path.exists(LANGUAGE_FILE):
+            language_store.migrate_from_json(load_legacy_languages())
+            retire_legacy_journals()
 else:
-    all_languages = {"guilds": {}}
+    # The shard directory only appears once the split has fully completed
+    if not os.path.isdir(GUILD_SHARD_DIR) and os.path.exists(LANGUAGE_FILE):
+        LanguagePersistence.migrate_from_json(GUILD_SHARD_DIR, load_legacy_languages())
+        retire_legacy_journals()
+    language_store = LanguagePersistence(GUILD_SHARD_DIR, LANGUAGE_SAVE_DEBOUNCE)
+
+# 🗂️ Guild configs load on first access instead of all at once
+all_languages = {"guilds": language_store.open()}
+
+if isinstance(language_store, LanguagePersistence):
+    language_store.replay_journal()
+    if os.path.exists(language_store.compacting_path) or language_store.journal_size >= language_store.journal_limit:
+        language_store.compact_now()
+
+# 🔢 Bumped on every admin edit so embeds cached from an older config are never served again
+guild_config_versions = defaultdict(int)  # guild_id -> version; the None key covers every guild
+
+def bump_guild_config_version(guild_id=None):
+    guild_config_versions[None if guild_id is None else str(guild_id)] += 1
+
+def guild_config_version(guild_id):
+    return guild_config_versions[None], guild_config_versions[guild_id]
 
-def save_languages():
-    with open(LANGUAGE_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_languages, f, indent=2, ensure_ascii=False)
+def save_languages(guild_id=None):
+    bump_guild_config_version(guild_id)
+    language_store.mark_dirty(guild_id)
+
+def set_user_language(guild_id: str, user_id: str, lang_code: str):
+    guild_config = all_languages["guilds"].setdefault(guild_id, {})
+    guild_config.setdefault("users", {})[user_id] = lang_code
+    language_store.record_user_language(guild_id, user_id, lang_code)
 
 def get_user_language(guild_id: str, user_id: str):
     try:
@@ -60,6 +1670,11 @@ def get_user_language(guild_id: str, user_id: str):
     except KeyError:
         return None
 
+def get_language_usage(guild_id: str):
+    """Members per language in a guild, from the index's running counts."""
+    users = all_languages["guilds"].get(guild_id, {}).get("users")
+    return users.usage() if isinstance(users, UserLanguageIndex) else {}
+
 # ========== MOOD COOKIES ==========
 
 def flutter_baby_speak(text):
@@ -121,79 +1736,89 @@ async def on_ready():
     except Exception as e:
         print(f"❗ Failed to sync spells: {e}")
 
-    await seasonal_check_once()  # 🌟 immediate seasonal mode check
-
+    bot.loop.create_task(seasonal_loop())  # 🌟 checks the season right away, then at each boundary
     bot.loop.create_task(glitch_reversion_loop())
-    bot.loop.create_task(decay_activity_loop())
     bot.loop.create_task(grove_heartbeat(bot))
-    bot.loop.create_task(seasonal_check_loop())
+    bot.loop.create_task(grove_snapshot_loop())
 
-async def seasonal_check_once():
-    now = datetime.now(timezone.utc)
+async def apply_seasonal_modes(seasonal_mode):
+    """One transition pass: move every guild into the active season, or back out of one that ended."""
+    transitions = []
     for guild in bot.guilds:
         guild_id = str(guild.id)
         current_mode = guild_modes.get(guild_id, "dayform")
 
-        if is_summer_solstice():
-            seasonal_mode = "sunfracture"
-        elif is_winter_solstice():
-            seasonal_mode = "yuleshard"
-        elif is_spring_equinox():
-            seasonal_mode = "vernalglint"
-        elif is_autumn_equinox():
-            seasonal_mode = "fallveil"
-        else:
-            seasonal_mode = None
-
         if seasonal_mode:
+            # Enter seasonal mode if not already active
             if current_mode != seasonal_mode:
-                previous_standard_mode_by_guild[guild_id] = current_mode
-                print(f"🌸 (Startup) Switching {guild_id} to seasonal mode: {seasonal_mode}")
-                await apply_mode_change(guild, seasonal_mode)
-                await update_avatar_for_mode(seasonal_mode)
-        else:
-            if current_mode in SEASONAL_MODES:
-                previous = previous_standard_mode_by_guild.get(guild_id, "basic")
-                print(f"🍂 (Startup) Reverting {guild_id} from seasonal mode {current_mode} to {previous}")
-                await apply_mode_change(guild, previous)
-                await update_avatar_for_mode(previous)
+                transitions.append((guild, seasonal_mode))
+        elif current_mode in SEASONAL_MODES:
+            # Revert seasonal mode once the season is over
+            previous = previous_standard_mode_by_guild.get(guild_id, "dayform")
+            if previous not in STANDARD_MODES:
+                previous = "dayform"
+            transitions.append((guild, previous))
+
+    # The avatar is global, so it follows the season even when no guild needed moving;
+    # the avatar controller skips the upload if it's already showing this image
+    await update_avatar_for_mode(seasonal_mode or "dayform")
+    if not transitions:
+        return
 
-async def seasonal_check_loop():
-    await bot.wait_until_ready()
+    # Every guild switches at once; only the announcements are paced
+    for guild, mode in transitions:
+        set_guild_mode(guild, mode)
+    print(f"{'🌸' if seasonal_mode else '🍂'} {len(transitions)} guilds moved to {seasonal_mode or 'their usual forms'}")
+    await fan_out_guilds(transitions, announce_mode_change, "Seasonal announcements")
+
+async def seasonal_loop():
+    """Apply the current season, then sleep until the calendar's next boundary."""
     while not bot.is_closed():
-        now = datetime.now(timezone.utc)
-        for guild in bot.guilds:
-            guild_id = str(guild.id)
-            current_mode = guild_modes.get(guild_id, "dayform")
-
-            # Determine current seasonal mode (if any)
-            if is_summer_solstice():
-                seasonal_mode = "sunfracture"
-            elif is_winter_solstice():
-                seasonal_mode = "yuleshard"
-            elif is_spring_equinox():
-                seasonal_mode = "vernalglint"
-            elif is_autumn_equinox():
-                seasonal_mode = "fallveil"
-            else:
-                seasonal_mode = None
-
-            if seasonal_mode:
-                # Enter seasonal mode if not already active
-                if current_mode != seasonal_mode:
-                    previous_standard_mode_by_guild[guild_id] = current_mode
-                    print(f"🌸 Switching {guild_id} to seasonal mode: {seasonal_mode}")
-                    await apply_mode_change(guild, seasonal_mode)
-                    await update_avatar_for_mode(seasonal_mode)
-            else:
-                # Revert seasonal mode if the date is no longer in-season
-                if current_mode in SEASONAL_MODES:
-                    previous = previous_standard_mode_by_guild.get(guild_id, "basic")
-                    print(f"🍂 Reverting {guild_id} from seasonal mode {current_mode} to {previous}")
-                    await apply_mode_change(guild, previous)
-                    await update_avatar_for_mode(previous)
+        seasonal_mode, next_boundary = current_season()
+        await apply_seasonal_modes(seasonal_mode)
+
+        print(f"🗓️ Next seasonal boundary: {next_boundary:%Y-%m-%d %H:%M} UTC")
+        delay = (next_boundary - datetime.now(timezone.utc)).total_seconds()
+        await asyncio.sleep(max(delay, 0) + 1)
+
+@bot.event
+async def on_guild_join(guild):
+    print(f"🌱 Joined a new grove: {guild.name}")
+    invalidate_announcement_channel(guild)
+    schedule_heartbeat(str(guild.id))
+
+@bot.event
+async def on_guild_remove(guild):
+    invalidate_announcement_channel(guild)
+
+# 📌 Anything that can change where Whisperling is allowed to speak drops the cached channel
+@bot.event
+async def on_guild_update(before, after):
+    if before.system_channel != after.system_channel:
+        invalidate_announcement_channel(after)
+
+@bot.event
+async def on_guild_channel_create(channel):
+    invalidate_announcement_channel(channel.guild)
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    invalidate_announcement_channel(after.guild)
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    invalidate_announcement_channel(channel.guild)
+    avatar_assets.forget_channel(channel.id)  # its messages, and their avatar attachments, are gone too
+
+@bot.event
+async def on_guild_role_update(before, after):
+    if after.is_default() or after in after.guild.me.roles:
+        invalidate_announcement_channel(after.guild)
 
-        await asyncio.sleep(3600)  # Run once per hour
+@bot.event
+async def on_member_update(before, after):
+    if after.id == bot.user.id and before.roles != after.roles:
+        invalidate_announcement_channel(after.guild)
 
 @bot.event
 async def on_message(message):
@@ -233,19 +1858,105 @@ previous_standard_mode_by_guild = defaultdict(lambda: "dayform")
 glitch_timestamps_by_guild = defaultdict(lambda: None)
 flutterkin_usage_count_by_guild = {}
 
-def get_translated_mode_text(guild_id, user_id, mode, key, fallback="", **kwargs):
+# (mode, key, lang) -> translated MODE_TEXTS template with {placeholders} intact
+translated_template_cache = {}
+
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+PROTECTED_PLACEHOLDER_PATTERN = re.compile(r"\[\[\s*(\d+)\s*\]\]")
+
+def protect_placeholders(template: str):
+    """Swap {name} placeholders for numbered [[n]] tokens the translator leaves alone."""
+    names = []
+
+    def _protect(match):
+        names.append(match.group(1))
+        return f"[[{len(names) - 1}]]"
+
+    return PLACEHOLDER_PATTERN.sub(_protect, template), names
+
+def restore_placeholders(translated: str, names):
+    """Put the original {name} placeholders back, or return None if any token was lost."""
+    seen = set()
+
+    def _restore(match):
+        index = int(match.group(1))
+        if index >= len(names):
+            return match.group(0)
+        seen.add(index)
+        return "{" + names[index] + "}"
+
+    restored = PROTECTED_PLACEHOLDER_PATTERN.sub(_restore, translated)
+    if len(seen) != len(names):
+        return None
+    return restored
+
+def fill_placeholders(template: str, **kwargs):
+    # Only known {name} placeholders are filled; stray braces from a translation are left alone
+    return PLACEHOLDER_PATTERN.sub(lambda m: str(kwargs.get(m.group(1), m.group(0))), template)
+
+async def translate_mode_template(mode, key, lang):
+    cache_key = (mode, key, lang)
+    if cache_key in translated_template_cache:
+        return translated_template_cache[cache_key]
+
+    base_text = MODE_TEXTS[mode][key]
+    protected, names = protect_placeholders(base_text)
+    translated = await translation_service.translate(protected, lang)
+    template = restore_placeholders(translated, names)
+
+    if template is not None:
+        translated_template_cache[cache_key] = template
+    return template
+
+async def translate_mode_templates(mode, keys, lang):
+    """Fill translated_template_cache for several keys of one mode in a single batched request."""
+    pending = [
+        key for key in dict.fromkeys(keys)
+        if key in MODE_TEXTS.get(mode, {}) and (mode, key, lang) not in translated_template_cache
+    ]
+    if len(pending) < 2:
+        return  # nothing to batch; translate_mode_template handles a lone key
+
+    protected = [protect_placeholders(MODE_TEXTS[mode][key]) for key in pending]
+    translated = await translation_service.translate_batch([text for text, _ in protected], lang)
+    for key, (_, names), text in zip(pending, protected, translated):
+        template = restore_placeholders(text, names)
+        if template is not None:
+            translated_template_cache[(mode, key, lang)] = template
+
+async def get_translated_mode_text(guild_id, user_id, mode, key, fallback="", **kwargs):
     lang = get_user_language(guild_id, user_id)
-    base_text = MODE_TEXTS.get(mode, {}).get(key, fallback)
-    formatted = base_text.format(**kwargs)
+    base_text = MODE_TEXTS.get(mode, {}).get(key)
 
     if not lang or lang == "en":
-        return formatted
+        return fill_placeholders(base_text if base_text is not None else fallback, **kwargs)
 
     try:
-        translated = translator.translate(formatted, dest=lang).text
-        return translated
+        if base_text is None:
+            # Fallbacks may already carry user-specific text, so they are not shared as templates
+            return await translation_service.translate(fill_placeholders(fallback, **kwargs), lang)
+
+        template = await translate_mode_template(mode, key, lang)
+        if template is None:
+            # The translator mangled a placeholder; translate this one filled-in string instead
+            return await translation_service.translate(fill_placeholders(base_text, **kwargs), lang)
+        return fill_placeholders(template, **kwargs)
     except Exception:
-        return formatted
+        return fill_placeholders(base_text if base_text is not None else fallback, **kwargs)
+
+async def get_translated_mode_texts(guild_id, user_id, mode, keys, fallbacks=None, **kwargs):
+    """Resolve several MODE_TEXTS keys at once, in order, for one welcome flow stage."""
+    fallbacks = fallbacks or {}
+    lang = get_user_language(guild_id, user_id)
+    if lang and lang != "en":
+        try:
+            await translate_mode_templates(mode, keys, lang)
+        except TranslationUnavailable:
+            pass  # each key below retries on its own and falls back to English
+    return await asyncio.gather(*(
+        get_translated_mode_text(guild_id, user_id, mode, key, fallback=fallbacks.get(key, ""), **kwargs)
+        for key in keys
+    ))
 
 def maybe_trigger_glitch(guild_id: str):
     """
@@ -263,94 +1974,174 @@ def get_flavor_text(mode):
 
 from datetime import datetime, timezone
 
+# 💓 Heartbeat scheduling: each guild sits in a min-heap keyed by the next time it
+# could possibly send flavor text or drift moods, so the loop only wakes for guilds that are due
+import heapq
+import itertools
+
+HEARTBEAT_INTERVAL = int(os.getenv("WHISPERLING_HEARTBEAT_INTERVAL", "600"))  # re-roll spacing once eligible
+HEARTBEAT_JITTER = int(os.getenv("WHISPERLING_HEARTBEAT_JITTER", "120"))
+FLAVOR_COOLDOWN = timedelta(hours=2)
+MOOD_DRIFT_IDLE = timedelta(days=30)
+
+heartbeat_heap = []  # (due timestamp, token, guild_id)
+heartbeat_token_by_guild = {}  # only the newest entry per guild is live
+heartbeat_counter = itertools.count()
+heartbeat_wake = asyncio.Event()
+# guild_id -> whispers_enabled, so scheduling never has to load a guild's config. Unknown guilds count
+# as enabled; their first heartbeat reads the real setting and reschedules if whispers are off.
+whispers_enabled_by_guild = {}
+
+def next_heartbeat_due(guild_id: str, now: datetime):
+    """Earliest time this guild could send flavor or drift, or None if neither can happen."""
+    earliest_roll = now + timedelta(seconds=HEARTBEAT_INTERVAL)
+    candidates = []
+
+    if whispers_enabled_by_guild.get(guild_id, True):
+        last_sent = last_flavor_sent.get(guild_id)
+        if last_sent is None or last_sent == datetime.min:
+            candidates.append(earliest_roll)
+        else:
+            if last_sent.tzinfo is None:
+                last_sent = last_sent.replace(tzinfo=timezone.utc)
+            candidates.append(max(last_sent + FLAVOR_COOLDOWN, earliest_roll))
+
+    if guild_modes.get(guild_id, "dayform") in STANDARD_MODES:
+        last_seen = last_interaction_by_guild.get(guild_id, now)
+        if last_seen.tzinfo is None:
+            last_seen = last_seen.replace(tzinfo=timezone.utc)
+        candidates.append(max(last_seen + MOOD_DRIFT_IDLE, earliest_roll))
+
+    return min(candidates) if candidates else None
+
+def schedule_heartbeat(guild_id: str, due: datetime = None):
+    """(Re)schedule a guild's heartbeat; call whenever whispers, mode or membership change."""
+    guild_id = str(guild_id)
+    if due is None:
+        due = next_heartbeat_due(guild_id, datetime.now(timezone.utc))
+    if due is None:
+        heartbeat_token_by_guild.pop(guild_id, None)
+        return
+
+    token = next(heartbeat_counter)
+    heartbeat_token_by_guild[guild_id] = token
+    due_ts = due.timestamp() + random.uniform(0, HEARTBEAT_JITTER)
+    heapq.heappush(heartbeat_heap, (due_ts, token, guild_id))
+    if heartbeat_heap[0][1] == token:
+        heartbeat_wake.set()  # earlier than whatever the loop is sleeping towards
+
+async def run_guild_heartbeat(guild, now: datetime):
+    guild_id = str(guild.id)
+    mode = guild_modes.get(guild_id, "dayform")
+    activity_level = get_activity_level(guild_id)
+
+    guild_config = all_languages["guilds"].get(guild_id, {})
+    whispers_enabled = guild_config.get("whispers_enabled", True)
+    whispers_enabled_by_guild[guild_id] = whispers_enabled
+
+    if whispers_enabled:
+        # 💡 Safely retrieve last flavor time, defaulting to "now minus cooldown" if missing
+        last_sent = last_flavor_sent.get(guild_id)
+
+        if last_sent is None or last_sent == datetime.min:
+            # If no record, treat as if cooldown expired
+            last_sent = now - FLAVOR_COOLDOWN
+
+        # 💡 Convert to timezone-aware if somehow naive
+        if last_sent.tzinfo is None:
+            last_sent = last_sent.replace(tzinfo=timezone.utc)
+
+        if now - last_sent >= FLAVOR_COOLDOWN:
+            base_flavor_chance = 0.03
+            weighted_chance = base_flavor_chance + (activity_level / 300)
+            flavor_chance = min(weighted_chance, 0.15)
+
+            if random.random() < flavor_chance:
+                flavor = get_flavor_text(mode)
+                channel = get_announcement_channel(guild)
+
+                if channel and flavor:
+                    lang_map = guild_config.get("languages", {})
+                    # 📖 Only whisper in languages someone here actually reads
+                    usage = get_language_usage(guild_id)
+                    possible_langs = [code for code in lang_map if usage.get(code)]
+
+                    if possible_langs and random.random() < 0.5:
+                        chosen_lang = random.choices(possible_langs, weights=[usage[code] for code in possible_langs])[0]
+                        try:
+                            translated = await translation_service.translate(flavor, chosen_lang)
+                            flavor_to_send = f"{translated} ({chosen_lang})"
+                        except Exception as e:
+                            print(f"🌐 Translation failed: {e}")
+                            flavor_to_send = flavor
+                    else:
+                        flavor_to_send = flavor
+
+                    await channel.send(flavor_to_send)
+                    last_flavor_sent[guild_id] = now
+
+    if mode in STANDARD_MODES:
+        last_seen = last_interaction_by_guild.get(guild_id, now)
+
+        if last_seen.tzinfo is None:
+            last_seen = last_seen.replace(tzinfo=timezone.utc)
+
+        if now - last_seen >= MOOD_DRIFT_IDLE and random.random() < 0.25:
+            possible_modes = [m for m in STANDARD_MODES if m != mode]
+            new_mode = random.choice(possible_modes)
+            print(f"🌿 Mood drift for {guild.name} -> {new_mode}")
+            await apply_mode_change(guild, new_mode)
+
 async def grove_heartbeat(bot):
     await bot.wait_until_ready()
 
+    for guild in bot.guilds:
+        schedule_heartbeat(str(guild.id))
+
     while not bot.is_closed():
-        now = datetime.now(timezone.utc)
-
-        for guild in bot.guilds:
-            guild_id = str(guild.id)
-            mode = guild_modes.get(guild_id, "dayform")
-            activity_level = get_activity_level(guild_id)
-
-            guild_config = all_languages["guilds"].get(guild_id, {})
-            whispers_enabled = guild_config.get("whispers_enabled", True)
-
-            if whispers_enabled:
-                # 💡 Safely retrieve last flavor time, defaulting to "now minus cooldown" if missing
-                last_sent = last_flavor_sent.get(guild_id)
-                
-                if last_sent is None:
-                    # If no record, treat as if cooldown expired
-                    last_sent = now - timedelta(hours=3)
-
-                # 💡 Convert to timezone-aware if somehow naive
-                if last_sent.tzinfo is None:
-                    last_sent = last_sent.replace(tzinfo=timezone.utc)
-
-                time_since_last = (now - last_sent).total_seconds()
-                cooldown_seconds = 2 * 60 * 60
-
-                if time_since_last >= cooldown_seconds:
-                    base_flavor_chance = 0.03
-                    weighted_chance = base_flavor_chance + (activity_level / 300)
-                    flavor_chance = min(weighted_chance, 0.15)
-
-                    if random.random() < flavor_chance:
-                        flavor = get_flavor_text(mode)
-                        channel = (
-                            guild.system_channel
-                            or next((c for c in guild.text_channels if c.permissions_for(guild.me).send_messages), None)
-                        )
-
-                        if channel and flavor:
-                            lang_map = guild_config.get("languages", {})
-
-                            if lang_map and random.random() < 0.5:
-                                possible_langs = list(lang_map.keys())
-                                chosen_lang = random.choice(possible_langs)
-                                try:
-                                    translated = translator.translate(flavor, dest=chosen_lang).text
-                                    flavor_to_send = f"{translated} ({chosen_lang})"
-                                except Exception as e:
-                                    print(f"🌐 Translation failed: {e}")
-                                    flavor_to_send = flavor
-                            else:
-                                flavor_to_send = flavor
-
-                            await channel.send(flavor_to_send)
-                            last_flavor_sent[guild_id] = now
-
-            if mode in STANDARD_MODES:
-                last_seen = last_interaction_by_guild.get(guild_id, now)
-                
-                if last_seen.tzinfo is None:
-                    last_seen = last_seen.replace(tzinfo=timezone.utc)
-
-                days_idle = (now - last_seen).days
-
-                if days_idle >= 30 and random.random() < 0.25:
-                    possible_modes = [m for m in STANDARD_MODES if m != mode]
-                    new_mode = random.choice(possible_modes)
-                    print(f"🌿 Mood drift for {guild.name} -> {new_mode}")
-                    await apply_mode_change(guild, new_mode)
-
-        await asyncio.sleep(600)
+        while heartbeat_heap and heartbeat_heap[0][0] <= time.time():
+            _, token, guild_id = heapq.heappop(heartbeat_heap)
+            if heartbeat_token_by_guild.get(guild_id) != token:
+                continue  # superseded by a later reschedule
+
+            guild = bot.get_guild(int(guild_id))
+            if guild is None:
+                heartbeat_token_by_guild.pop(guild_id, None)
+                continue
+
+            try:
+                await run_guild_heartbeat(guild, datetime.now(timezone.utc))
+            except Exception as e:
+                print(f"❗ Heartbeat failed for {guild_id}: {e}")
+
+            if heartbeat_token_by_guild.get(guild_id) == token:
+                schedule_heartbeat(guild_id)
+
+        timeout = max(heartbeat_heap[0][0] - time.time(), 0) if heartbeat_heap else None
+        heartbeat_wake.clear()
+        try:
+            await asyncio.wait_for(heartbeat_wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
 
 @bot.hybrid_command(name="formcompendium", description="🌿 Browse Whisperling’s forms with full mood & flavor profiles!")
 async def formcompendium(ctx):
+    # Not mode-specific: keyed on the bot's current avatar instead
+    avatar_url = bot.user.avatar.url if bot.user.avatar else None
+    embed = cached_embed("formcompendium", avatar_url, build_formcompendium_embed)
+
+    view = FormCompendiumDropdown(ctx)
+    await ctx.send(embed=embed, view=view)
+
+def build_formcompendium_embed(avatar_url, guild_id=None):
     embed = discord.Embed(
         title="🌿 Whisperling Form Compendium",
         description="Gently select a form to explore its mood & flavor:",
         color=discord.Color.blurple()
     )
-    avatar_url = bot.user.avatar.url if bot.user.avatar else None
     if avatar_url:
         embed.set_thumbnail(url=avatar_url)
-
-    view = FormCompendiumDropdown(ctx)
-    await ctx.send(embed=embed, view=view)
+    return embed
 
 
 class FormCompendiumDropdown(View):
@@ -402,55 +2193,162 @@ def style_text(guild_id, text):
     mode = guild_modes[str(guild_id)]
     return MODE_TONE.get(mode, lambda t: t)(text)
 
-def is_spring_equinox():
-    today = datetime.now(timezone.utc)
-    return today.month == 3 and 20 <= today.day <= 27
-
-def is_autumn_equinox():
-    today = datetime.now(timezone.utc)
-    return today.month == 9 and 22 <= today.day <= 29
-
-def is_summer_solstice():
-    today = datetime.now(timezone.utc)
-    return today.month == 6 and 21 <= today.day <= 28
+# 🧩 Read-mostly embeds are built once per (kind, mode, guild config version) and handed out as copies
+EMBED_TEMPLATE_CACHE_SIZE = int(os.getenv("WHISPERLING_EMBED_CACHE_SIZE", "1024"))
+embed_templates = OrderedDict()
 
-def is_winter_solstice():
-    today = datetime.now(timezone.utc)
-    return today.month == 12 and 21 <= today.day <= 28
+def cached_embed(kind, mode, builder, guild_id=None):
+    """
+    Return a copy of the embed builder(mode, guild_id) would make. Pass guild_id
+    only for embeds that read the guild's config; its version is part of the key.
+    """
+    key = (kind, mode, guild_id, guild_config_version(guild_id) if guild_id else None)
+    template = embed_templates.get(key)
+    if template is None:
+        template = builder(mode, guild_id)
+        embed_templates[key] = template
+        if len(embed_templates) > EMBED_TEMPLATE_CACHE_SIZE:
+            embed_templates.popitem(last=False)
+    else:
+        embed_templates.move_to_end(key)
+    return template.copy()
+
+# 🗓️ Seasonal windows (UTC): mode, month, first day, last day
+SEASON_WINDOWS = [
+    ("vernalglint", 3, 20, 27),
+    ("sunfracture", 6, 21, 28),
+    ("fallveil", 9, 22, 29),
+    ("yuleshard", 12, 21, 28),
+]
+season_calendars = {}
+
+def season_calendar(year: int):
+    """(start, end, mode) for each season of a year, computed once per year."""
+    calendar = season_calendars.get(year)
+    if calendar is None:
+        calendar = [
+            (
+                datetime(year, month, first, tzinfo=timezone.utc),
+                datetime(year, month, last, tzinfo=timezone.utc) + timedelta(days=1),
+                mode,
+            )
+            for mode, month, first, last in SEASON_WINDOWS
+        ]
+        season_calendars[year] = calendar
+    return calendar
+
+def current_season(now=None):
+    """Return (active seasonal mode or None, the moment that answer next changes)."""
+    now = now or datetime.now(timezone.utc)
+    for start, end, mode in season_calendar(now.year) + season_calendar(now.year + 1):
+        if now < start:
+            return None, start
+        if now < end:
+            return mode, end
 
 # --- Avatar updates ---
+import hashlib
+
+AVATAR_IMAGES = {
+    "sunfracture": "sunfracture",
+    "yuleshard": "yuleshard",
+    "vernalglint": "vernalglint",
+    "fallveil": "fallveil",
+    "basic": "basic_whisperling",
+}
+AVATAR_BACKOFF_MAX = 3600
 
-async def update_avatar_for_mode(mode: str):
-    avatar_paths = {
-        "sunfracture": "avatars/sunfracture.png",
-        "yuleshard": "avatars/yuleshard.png",
-        "vernalglint": "avatars/vernalglint.png",
-        "fallveil": "avatars/fallveil.png",
-        "basic": "avatars/basic_whisperling.png"
-    }
+class AvatarController:
+    """
+    The only thing that edits the bot's global avatar. Callers just say which
+    avatar they want; a single worker applies the latest wish, skips it when
+    that image (by hash) is already set, and waits out Discord's retry-after
+    or an exponential backoff after a failure. A burst of requests costs at
+    most one profile edit.
+    """
 
-    avatar_key = mode if mode in SEASONAL_MODES else "basic"
-    path = avatar_paths.get(avatar_key)
+    def __init__(self):
+        self.desired = None
+        self.current_hash = None  # sha256 of the image last applied (persisted in the grove snapshot)
+        self.retry_at = 0.0
+        self.failures = 0
+        self.edits = 0
+        self.skipped = 0
+        self._wake = asyncio.Event()
+        self._task = None
+
+    def request(self, avatar_key):
+        self.desired = avatar_key
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            avatar_key = self.desired
+            image = avatar_assets.images.get(AVATAR_IMAGES.get(avatar_key, ""))
+            if image is None:
+                print(f"⚠️ No avatar found for mode: {avatar_key}")
+            elif hashlib.sha256(image).hexdigest() == self.current_hash:
+                self.skipped += 1
+            else:
+                delay = self.retry_at - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue  # the wish may have changed while we waited
 
-    if path and os.path.exists(path):
-        with open(path, 'rb') as f:
+                try:
+                    await bot.user.edit(avatar=image)
+                    self.current_hash = hashlib.sha256(image).hexdigest()
+                    self.failures = 0
+                    self.edits += 1
+                    print(f"✨ Avatar updated for mode: {avatar_key}")
+                except Exception as e:
+                    # Anything escaping here would end the worker and freeze the avatar for good
+                    self.failures += 1
+                    retry_after = self.retry_after(e) or min(60 * 2 ** (self.failures - 1), AVATAR_BACKOFF_MAX)
+                    self.retry_at = time.time() + retry_after
+                    print(f"❗ Failed to update avatar (retrying in {retry_after:.0f}s): {e}")
+                    continue
+
+            if self.desired == avatar_key:
+                await self._wake.wait()
+
+    @staticmethod
+    def retry_after(error):
+        """Seconds Discord asked us to wait before the next edit, or None if it didn't say."""
+        if isinstance(error, discord.RateLimited):
+            return error.retry_after
+        if isinstance(error, discord.HTTPException) and error.status == 429:
+            headers = getattr(error.response, "headers", None) or {}
             try:
-                await bot.user.edit(avatar=f.read())
-                print(f"✨ Avatar updated for mode: {avatar_key}")
-            except discord.HTTPException as e:
-                print(f"❗ Failed to update avatar: {e}")
-    else:
-        print(f"⚠️ No avatar found for mode: {avatar_key}")
+                return float(headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                return None
+        return None
+
+avatar_controller = AvatarController()
+
+async def update_avatar_for_mode(mode: str):
+    avatar_controller.request(mode if mode in SEASONAL_MODES else "basic")
 
 from discord.ext import tasks
 
 # --- Apply mode change safely ---
 
 async def apply_mode_change(guild, mode):
+    set_guild_mode(guild, mode)
+    await announce_mode_change(guild, mode)
+
+def set_guild_mode(guild, mode):
+    """Record a mode change without announcing it."""
     guild_id = str(guild.id)
     now = datetime.now(timezone.utc)
 
-    previous_standard_mode_by_guild[guild_id] = guild_modes.get(guild_id, "dayform")
+    current_mode = guild_modes.get(guild_id, "dayform")
+    if current_mode in STANDARD_MODES:
+        previous_standard_mode_by_guild[guild_id] = current_mode
     guild_modes[guild_id] = mode
 
     if mode in GLITCHED_MODES or mode in SEASONAL_MODES:
@@ -459,56 +2357,302 @@ async def apply_mode_change(guild, mode):
         glitch_timestamps_by_guild[guild_id] = None
 
     last_interaction_by_guild[guild_id] = now
+    schedule_heartbeat(guild_id)
+    schedule_reversion(guild_id)
 
-    await announce_mode_change(guild, mode)
+# --- Announcement channel cache ---
+
+announcement_channel_by_guild = {}  # guild_id -> channel id, or None when nothing is writable
+
+def get_announcement_channel(guild):
+    """The system channel, else the first text channel Whisperling may write in; cached per guild."""
+    guild_id = str(guild.id)
+    if guild_id in announcement_channel_by_guild:
+        channel_id = announcement_channel_by_guild[guild_id]
+        return guild.get_channel(channel_id) if channel_id is not None else None
+
+    channel = (
+        guild.system_channel
+        or next((c for c in guild.text_channels if c.permissions_for(guild.me).send_messages), None)
+    )
+    announcement_channel_by_guild[guild_id] = channel.id if channel else None
+    return channel
+
+def invalidate_announcement_channel(guild):
+    announcement_channel_by_guild.pop(str(guild.id), None)
+
+# --- Avatar assets ---
+import io
+from urllib.parse import urlparse, parse_qs
+
+class AvatarAssets:
+    """
+    Form avatars read into memory once at startup. The first embed for a
+    form uploads the image as an attachment; the CDN URL Discord gives it
+    back is remembered and reused as the thumbnail until it's about to expire,
+    or until the message that carries the attachment is deleted.
+    """
+
+    EXPIRY_MARGIN = 3600  # stop reusing a signed CDN URL an hour before it lapses
+
+    def __init__(self, directory):
+        self.images = {}
+        self.urls = {}  # mode -> (url, expires_at or None, message id, channel id)
+        self.uploads = 0
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.endswith(".png"):
+                    with open(os.path.join(directory, name), "rb") as f:
+                        self.images[name[:-len(".png")]] = f.read()
+        print(f"🖼️ Preloaded {len(self.images)} avatars.")
+
+    def cached_url(self, mode):
+        url, expires_at, _, _ = self.urls.get(mode, (None, None, None, None))
+        if url and (expires_at is None or expires_at - self.EXPIRY_MARGIN > time.time()):
+            return url
+        return None
+
+    def attach(self, embed, mode):
+        """Point the embed's thumbnail at the form's avatar; returns a file to upload, or None."""
+        url = self.cached_url(mode)
+        if url:
+            embed.set_thumbnail(url=url)
+            return None
+
+        image = self.images.get(mode)
+        if image is None:
+            return None  # no avatar for this form
+        embed.set_thumbnail(url="attachment://avatar.png")
+        return discord.File(io.BytesIO(image), filename="avatar.png")
+
+    def remember(self, mode, message):
+        """Keep the CDN URL of an avatar we just uploaded with a message."""
+        if not message or not message.embeds or not message.embeds[0].thumbnail.url:
+            return
+        url = message.embeds[0].thumbnail.url
+        expiry = parse_qs(urlparse(url).query).get("ex")
+        try:
+            expires_at = int(expiry[0], 16) if expiry else None
+        except ValueError:
+            expires_at = None
+        self.urls[mode] = (url, expires_at, message.id, message.channel.id)
+        self.uploads += 1
+
+    def forget_messages(self, message_ids):
+        """Drop URLs whose attachment went away with a deleted message; the next embed re-uploads."""
+        for mode, (_, _, message_id, _) in list(self.urls.items()):
+            if message_id in message_ids:
+                del self.urls[mode]
+
+    def forget_channel(self, channel_id):
+        for mode, (_, _, _, source_channel_id) in list(self.urls.items()):
+            if source_channel_id == channel_id:
+                del self.urls[mode]
+
+avatar_assets = AvatarAssets("avatars")
 
 # --- Build embed correctly ---
 
-def build_whisperling_embed(guild_id, title: str, description: str):
-    mode = guild_modes.get(str(guild_id), "dayform")
+async def send_with_avatar(destination, embed, mode, **kwargs):
+    """Send an embed with the form's avatar as its thumbnail, remembering the URL if it had to be uploaded."""
+    # Only the first embed per form uploads the image; later ones reuse its URL
+    file = avatar_assets.attach(embed, mode)
+    if file:
+        message = await destination.send(embed=embed, file=file, **kwargs)
+        avatar_assets.remember(mode, message)
+    else:
+        message = await destination.send(embed=embed, **kwargs)
+    return message
 
-    avatar_path = f"avatars/{mode}.png"
+@bot.event
+async def on_raw_message_delete(payload):
+    avatar_assets.forget_messages({payload.message_id})
+
+@bot.event
+async def on_raw_bulk_message_delete(payload):
+    avatar_assets.forget_messages(payload.message_ids)
 
+async def send_whisperling_embed(destination, guild_id, title: str, description: str, **kwargs):
+    """Build a mode-styled embed and send it with the form's avatar."""
+    mode = guild_modes.get(str(guild_id), "dayform")
     embed = discord.Embed(
         title=title,
         description=description,
         color=MODE_COLORS.get(mode, discord.Color.green())
     )
-
-    if os.path.exists(avatar_path):
-        file = discord.File(avatar_path, filename="avatar.png")
-        embed.set_thumbnail(url="attachment://avatar.png")
-        return embed, file
-    else:
-        # Fallback only if file missing
-        return embed, None
+    return await send_with_avatar(destination, embed, mode, **kwargs)
 
 async def announce_mode_change(guild, mode):
-    embed, file = build_whisperling_embed(
+    channel = get_announcement_channel(guild)
+
+    if not channel:
+        print(f"⚠️ No writable channel found in {guild.name} for mode announcement.")
+        return
+
+    await send_whisperling_embed(
+        channel,
         str(guild.id),  # always cast to string for consistency
         f"✨ Whisperling shifts into {mode.title()}",
         MODE_DESCRIPTIONS.get(mode, "Whisperling gently shifts.")
     )
 
-    channel = (
-        guild.system_channel
-        or next((c for c in guild.text_channels if c.permissions_for(guild.me).send_messages), None)
-    )
+# --- Guild fan-out ---
 
-    if not channel:
-        print(f"⚠️ No writable channel found in {guild.name} for mode announcement.")
+GUILD_FANOUT_CONCURRENCY = int(os.getenv("WHISPERLING_FANOUT_CONCURRENCY", "16"))
+GUILD_FANOUT_RATE = float(os.getenv("WHISPERLING_FANOUT_RATE", "25"))  # starts per second, under Discord's global 50/s
+GUILD_FANOUT_RETRIES = 3
+
+class RateLimiter:
+    """Spaces out call starts so a burst across many guilds stays under the global rate limit."""
+
+    def __init__(self, rate):
+        self.interval = 1 / rate if rate > 0 else 0
+        self.next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+async def fan_out_guilds(items, action, label):
+    """
+    Run action(*item) for many guilds at once, at most GUILD_FANOUT_CONCURRENCY
+    at a time and GUILD_FANOUT_RATE starts per second. A 429 that slips past
+    discord.py's own handling is retried after its retry_after.
+    """
+    items = list(items)
+    if not items:
         return
+    semaphore = asyncio.Semaphore(GUILD_FANOUT_CONCURRENCY)
+    limiter = RateLimiter(GUILD_FANOUT_RATE)
+    started = time.monotonic()
+    progress_step = max(len(items) // 10, 1)
+
+    async def run(item):
+        async with semaphore:
+            for attempt in range(GUILD_FANOUT_RETRIES):
+                await limiter.acquire()
+                try:
+                    await action(*item)
+                    return True
+                except discord.HTTPException as e:
+                    if e.status != 429 or attempt == GUILD_FANOUT_RETRIES - 1:
+                        print(f"❗ {label} failed for {item[0]}: {e}")
+                        return False
+                    await asyncio.sleep(getattr(e, "retry_after", None) or 2 ** attempt)
+                except Exception as e:
+                    print(f"❗ {label} failed for {item[0]}: {e}")
+                    return False
 
-    if file:
-        await channel.send(embed=embed, file=file)
-    else:
-        await channel.send(embed=embed)
+    done = failed = 0
+    print(f"📣 {label}: {len(items)} guilds")
+    for finished in asyncio.as_completed([run(item) for item in items]):
+        if not await finished:
+            failed += 1
+        done += 1
+        if done % progress_step == 0 or done == len(items):
+            print(f"📣 {label}: {done}/{len(items)} done, {failed} failed, {time.monotonic() - started:.1f}s")
+
+# --- Temporary form reversion ---
+
+GLITCH_DURATION = timedelta(minutes=int(os.getenv("WHISPERLING_GLITCH_MINUTES", "30")))
+FLUTTERKIN_DURATION = timedelta(minutes=int(os.getenv("WHISPERLING_FLUTTERKIN_MINUTES", "15")))
+
+reversion_heap = []  # (expiry timestamp, guild_id)
+reversion_due_by_guild = {}
+reversion_wake = asyncio.Event()
+
+def temporary_form_expiry(guild_id: str):
+    """
+    When the guild's glitched or flutterkin form should end, or None if it has
+    nothing to revert. Seasonal forms end with the season, which seasonal_loop
+    handles for every guild in one paced pass.
+    """
+    mode = guild_modes.get(guild_id, "dayform")
+    started = glitch_timestamps_by_guild.get(guild_id)
+    if mode in STANDARD_MODES or mode in SEASONAL_MODES or started is None:
+        return None
+    if mode == "flutterkin":
+        # Each whisper keeps Flutterkin awake a little longer
+        return max(started, flutterkin_last_triggered.get(guild_id, started)) + FLUTTERKIN_DURATION
+    return started + GLITCH_DURATION
+
+def schedule_reversion(guild_id: str):
+    guild_id = str(guild_id)
+    expiry = temporary_form_expiry(guild_id)
+    if expiry is None:
+        reversion_due_by_guild.pop(guild_id, None)
+        return
+
+    expiry_ts = expiry.timestamp()
+    if reversion_due_by_guild.get(guild_id) == expiry_ts:
+        return
+    reversion_due_by_guild[guild_id] = expiry_ts
+    heapq.heappush(reversion_heap, (expiry_ts, guild_id))
+    if reversion_heap[0] == (expiry_ts, guild_id):
+        reversion_wake.set()
+
+async def revert_temporary_form(guild):
+    guild_id = str(guild.id)
+    current_mode = guild_modes.get(guild_id, "dayform")
+
+    # Back to the running season if there is one, otherwise the last standard form
+    seasonal_mode, _ = current_season()
+    target = seasonal_mode or previous_standard_mode_by_guild.get(guild_id, "dayform")
+    if target not in STANDARD_MODES and target != seasonal_mode:
+        target = "dayform"
+
+    print(f"🔁 Reverting {guild_id} from {current_mode} to {target}")
+    await apply_mode_change(guild, target)
+    if current_mode == "flutterkin":
+        await update_avatar_for_mode(target)
+
+async def glitch_reversion_loop():
+    await bot.wait_until_ready()
+
+    # Forms restored from the grove snapshot need their expiries queued too
+    for guild_id in list(glitch_timestamps_by_guild):
+        schedule_reversion(guild_id)
+
+    while not bot.is_closed():
+        while reversion_heap and reversion_heap[0][0] <= time.time():
+            expiry_ts, guild_id = heapq.heappop(reversion_heap)
+            if reversion_due_by_guild.get(guild_id) != expiry_ts:
+                continue  # rescheduled or already reverted
+
+            # Re-check on pop: a whisper may have extended the form since it was queued
+            expiry = temporary_form_expiry(guild_id)
+            if expiry is None:
+                reversion_due_by_guild.pop(guild_id, None)
+                continue
+            if expiry.timestamp() > time.time():
+                schedule_reversion(guild_id)
+                continue
+
+            reversion_due_by_guild.pop(guild_id, None)
+            guild = bot.get_guild(int(guild_id))
+            if guild is None:
+                continue
+            try:
+                await revert_temporary_form(guild)
+            except Exception as e:
+                print(f"❗ Failed to revert {guild_id}: {e}")
+
+        timeout = max(reversion_heap[0][0] - time.time(), 0) if reversion_heap else None
+        reversion_wake.clear()
+        try:
+            await asyncio.wait_for(reversion_wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
 
 # ================= ACTIVITY TRACKER =================
 
-# Core activity storage
-activity_score_by_guild = defaultdict(int)
-last_decay_by_guild = defaultdict(lambda: datetime.utcnow())
+# Core activity storage: guild_id -> (score, time.time() it was last brought up to date)
+activity_score_by_guild = {}
 last_active_channel_by_guild = {}
 last_flavor_sent = defaultdict(lambda: datetime.min)
 
@@ -518,53 +2662,319 @@ VOICE_WEIGHT = 10
 DECAY_AMOUNT = 1
 DECAY_INTERVAL = timedelta(minutes=2)
 MAX_ACTIVITY_SCORE = 100
+ACTIVITY_DECAY = os.getenv("WHISPERLING_ACTIVITY_DECAY", "linear").lower()  # or "exponential"
+ACTIVITY_HALF_LIFE = float(os.getenv("WHISPERLING_ACTIVITY_HALF_LIFE", "1800"))  # seconds, exponential only
+
+# Scores decay analytically from their last update, so no loop has to sweep them
+def decayed_activity(score: float, elapsed: float) -> float:
+    if elapsed <= 0:
+        return score
+    if ACTIVITY_DECAY == "exponential":
+        return score * 0.5 ** (elapsed / ACTIVITY_HALF_LIFE)
+    return max(score - DECAY_AMOUNT * elapsed / DECAY_INTERVAL.total_seconds(), 0)
+
+def current_activity(guild_id: str, now: float) -> float:
+    score, updated = activity_score_by_guild.get(guild_id, (0, now))
+    return decayed_activity(score, now - updated)
+
+def add_activity(guild_id: str, weight: int):
+    now = time.time()
+    activity_score_by_guild[guild_id] = (min(current_activity(guild_id, now) + weight, MAX_ACTIVITY_SCORE), now)
 
 # Called whenever a message is sent
 def register_message_activity(guild_id: str, channel_id: str):
-    activity_score_by_guild[guild_id] = min(
-        activity_score_by_guild[guild_id] + MESSAGE_WEIGHT, MAX_ACTIVITY_SCORE
-    )
+    add_activity(guild_id, MESSAGE_WEIGHT)
     last_active_channel_by_guild[guild_id] = channel_id
 
 # Called whenever someone joins voice
 def register_voice_activity(guild_id: str):
-    activity_score_by_guild[guild_id] = min(
-        activity_score_by_guild[guild_id] + VOICE_WEIGHT, MAX_ACTIVITY_SCORE
-    )
-
-# Activity decay loop
-async def decay_activity_loop():
-    while True:
-        now = datetime.utcnow()
-        for guild_id in list(activity_score_by_guild.keys()):
-            last_decay = last_decay_by_guild[guild_id]
-            if now - last_decay >= DECAY_INTERVAL:
-                activity_score_by_guild[guild_id] = max(
-                    activity_score_by_guild[guild_id] - DECAY_AMOUNT, 0
-                )
-                last_decay_by_guild[guild_id] = now
-        await asyncio.sleep(60)
+    add_activity(guild_id, VOICE_WEIGHT)
 
 # Called by grove heartbeat to read current activity
 def get_activity_level(guild_id: str) -> int:
-    return activity_score_by_guild[guild_id]
+    return round(current_activity(guild_id, time.time()))
+
+# ================= GROVE STATE SNAPSHOTS =================
+import struct
+import zlib
+
+GROVE_STATE_FILE = os.getenv("WHISPERLING_STATE_FILE", "grove_state.bin")
+GROVE_STATE_INTERVAL = int(os.getenv("WHISPERLING_STATE_INTERVAL", "300"))
+GROVE_STATE_MAGIC = b"WGRV"
+GROVE_STATE_VERSION = 1
+GROVE_STATE_HEADER = struct.Struct(">4sH")
+
+def _to_timestamp(value):
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    try:
+        return value.timestamp()
+    except (OverflowError, ValueError):
+        return None  # datetime.min placeholders
+
+def _from_timestamp(value):
+    return None if value is None else datetime.fromtimestamp(value, tz=timezone.utc)
+
+def _timestamps(mapping):
+    return {guild_id: ts for guild_id, ts in ((g, _to_timestamp(v)) for g, v in mapping.items()) if ts is not None}
+
+def build_grove_snapshot() -> bytes:
+    """Pack the volatile per-guild grove state into a compact versioned blob."""
+    state = {
+        "guild_modes": dict(guild_modes),
+        "previous_standard_mode_by_guild": dict(previous_standard_mode_by_guild),
+        "glitch_timestamps_by_guild": {
+            guild_id: _to_timestamp(ts) for guild_id, ts in glitch_timestamps_by_guild.items()
+        },
+        "activity_score_by_guild": {guild_id: list(entry) for guild_id, entry in activity_score_by_guild.items()},
+        "last_flavor_sent": _timestamps(last_flavor_sent),
+        "last_interaction_by_guild": _timestamps(last_interaction_by_guild),
+        "flutterkin_usage_count_by_guild": {
+            guild_id: {"count": usage["count"], "reset_time": _to_timestamp(usage["reset_time"])}
+            for guild_id, usage in flutterkin_usage_count_by_guild.items()
+        },
+        "avatar_hash": avatar_controller.current_hash,
+    }
+    payload = zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"), 6)
+    return GROVE_STATE_HEADER.pack(GROVE_STATE_MAGIC, GROVE_STATE_VERSION) + payload
+
+def restore_grove_snapshot(path=GROVE_STATE_FILE):
+    if not os.path.exists(path):
+        return
+
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        magic, version = GROVE_STATE_HEADER.unpack_from(blob)
+        if magic != GROVE_STATE_MAGIC or version != GROVE_STATE_VERSION:
+            print(f"⚠️ Ignoring grove snapshot with unknown format (version {version}).")
+            return
+        state = json.loads(zlib.decompress(blob[GROVE_STATE_HEADER.size:]))
+    except Exception as e:
+        print(f"⚠️ Could not read grove snapshot: {e}")
+        return
+
+    guild_modes.update(state.get("guild_modes", {}))
+    previous_standard_mode_by_guild.update(state.get("previous_standard_mode_by_guild", {}))
+    glitch_timestamps_by_guild.update({
+        guild_id: _from_timestamp(ts) for guild_id, ts in state.get("glitch_timestamps_by_guild", {}).items()
+    })
+    restored_at = time.time()
+    activity_score_by_guild.update({
+        # Older snapshots stored a bare score
+        guild_id: tuple(entry) if isinstance(entry, list) else (entry, restored_at)
+        for guild_id, entry in state.get("activity_score_by_guild", {}).items()
+    })
+    last_flavor_sent.update({
+        guild_id: _from_timestamp(ts) for guild_id, ts in state.get("last_flavor_sent", {}).items()
+    })
+    last_interaction_by_guild.update({
+        guild_id: _from_timestamp(ts) for guild_id, ts in state.get("last_interaction_by_guild", {}).items()
+    })
+    flutterkin_usage_count_by_guild.update({
+        guild_id: {"count": usage["count"], "reset_time": _from_timestamp(usage["reset_time"])}
+        for guild_id, usage in state.get("flutterkin_usage_count_by_guild", {}).items()
+    })
+    avatar_controller.current_hash = state.get("avatar_hash")
+    print(f"🌙 Restored grove state for {len(state.get('guild_modes', {}))} guilds.")
+
+def save_grove_snapshot():
+    try:
+        write_file_atomically(GROVE_STATE_FILE, build_grove_snapshot())
+    except Exception as e:
+        print(f"❗ Failed to save grove snapshot: {e}")
+
+async def grove_snapshot_loop():
+    await bot.wait_until_ready()
+    loop = asyncio.get_running_loop()
+    while not bot.is_closed():
+        await asyncio.sleep(GROVE_STATE_INTERVAL)
+        blob = build_grove_snapshot()
+        try:
+            await loop.run_in_executor(None, write_file_atomically, GROVE_STATE_FILE, blob)
+        except Exception as e:
+            print(f"❗ Failed to save grove snapshot: {e}")
+
+# 🌙 Pick up where the grove left off, before on_ready runs
+restore_grove_snapshot()
+
+# ================= BACKUPS =================
+import tarfile
+
+BACKUP_DIR = os.getenv("WHISPERLING_BACKUP_DIR", "backups")
+BACKUP_FULL_EVERY = int(os.getenv("WHISPERLING_BACKUP_FULL_EVERY", "10"))  # deltas before the next full snapshot
+BACKUP_KEEP_FULL = int(os.getenv("WHISPERLING_BACKUP_KEEP_FULL", "3"))  # full snapshots (with their deltas) kept on disk
+
+def canonical_guild_payload(config) -> bytes:
+    # Sorted keys so an unchanged guild always hashes the same, whichever store it came from
+    return json.dumps(config, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_encode_default).encode("utf-8")
+
+class GroveBackups:
+    """
+    Gzipped tar backups of every guild config. A full snapshot holds every
+    guild; a delta holds only guilds whose content hash changed since the
+    previous backup, plus the ids of guilds that were removed. The manifest
+    records the chain and the hashes the next delta is compared against.
+    Guilds are read and archived one at a time, so memory stays flat.
+    """
+
+    def __init__(self, directory, full_every, keep_full):
+        self.directory = directory
+        self.full_every = full_every
+        self.keep_full = keep_full
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self._lock = threading.Lock()
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"backups": [], "hashes": {}}
+
+    def _archive_path(self, name):
+        return os.path.join(self.directory, name)
+
+    def create(self, store, full=False):
+        """Blocking: write a full or delta archive. Returns its manifest entry, or None if nothing changed."""
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            manifest = self.load_manifest()
+            backups = manifest["backups"]
+            previous = manifest["hashes"]
+
+            deltas_since_full = 0
+            for entry in reversed(backups):
+                if entry["kind"] == "full":
+                    break
+                deltas_since_full += 1
+            kind = "full" if full or not backups or deltas_since_full >= self.full_every else "delta"
+
+            created = datetime.now(timezone.utc)
+            name = f"{created:%Y%m%d-%H%M%S}-{kind}.tar.gz"
+            suffix = 1
+            while os.path.exists(self._archive_path(name)):
+                suffix += 1
+                name = f"{created:%Y%m%d-%H%M%S}-{suffix}-{kind}.tar.gz"
+
+            hashes = {}
+            changed = 0
+            tmp_path = f"{self._archive_path(name)}.tmp"
+            with tarfile.open(tmp_path, "w:gz") as archive:
+                for guild_id in sorted(store.read_guild_ids()):
+                    config = store.read_guild(guild_id)
+                    if config is None:
+                        continue
+                    payload = canonical_guild_payload(config)
+                    digest = hashlib.sha256(payload).hexdigest()
+                    hashes[guild_id] = digest
+                    if kind == "full" or previous.get(guild_id) != digest:
+                        self._add_member(archive, f"guilds/{guild_id}.json", payload, created)
+                        changed += 1
+
+                deleted = sorted(set(previous) - set(hashes)) if kind == "delta" else []
+                meta = {"kind": kind, "created": created.isoformat(), "base": backups[-1]["name"] if kind == "delta" else None, "deleted": deleted}
+                self._add_member(archive, "backup.json", json.dumps(meta).encode("utf-8"), created)
+
+            if kind == "delta" and not changed and not deleted:
+                os.remove(tmp_path)
+                return None
+            os.replace(tmp_path, self._archive_path(name))
+
+            entry = {
+                "name": name,
+                "kind": kind,
+                "created": meta["created"],
+                "base": meta["base"],
+                "guilds": changed,
+                "deleted": len(deleted),
+                "bytes": os.path.getsize(self._archive_path(name)),
+            }
+            backups.append(entry)
+            manifest["hashes"] = hashes
+            self._prune(manifest)
+            write_file_atomically(self.manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+            return entry
+
+    @staticmethod
+    def _add_member(archive, name, payload, created):
+        info = tarfile.TarInfo(name)
+        info.size = len(payload)
+        info.mtime = created.timestamp()
+        archive.addfile(info, io.BytesIO(payload))
+
+    def _prune(self, manifest):
+        # Drop whole chains older than the last keep_full full snapshots
+        fulls = [i for i, entry in enumerate(manifest["backups"]) if entry["kind"] == "full"]
+        if len(fulls) <= self.keep_full:
+            return
+        cutoff = fulls[-self.keep_full]
+        for entry in manifest["backups"][:cutoff]:
+            try:
+                os.remove(self._archive_path(entry["name"]))
+            except FileNotFoundError:
+                pass
+        manifest["backups"] = manifest["backups"][cutoff:]
+
+    def chain(self, name=None):
+        """Manifest entries needed to rebuild the named backup (the latest if None): its full snapshot, then deltas."""
+        backups = self.load_manifest()["backups"]
+        names = [entry["name"] for entry in backups]
+        if not backups or (name is not None and name not in names):
+            return None
+        end = len(backups) - 1 if name is None else names.index(name)
+        start = end
+        while backups[start]["kind"] != "full":
+            start -= 1
+            if start < 0:
+                return None
+        return backups[start:end + 1]
+
+    def load(self, name=None):
+        """Blocking: rebuild every guild config as of the named backup. Returns None if it can't be found."""
+        chain = self.chain(name)
+        if chain is None:
+            return None
+        configs = {}
+        for entry in chain:
+            with tarfile.open(self._archive_path(entry["name"]), "r:gz") as archive:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+                    data = archive.extractfile(member).read()
+                    if member.name == "backup.json":
+                        for guild_id in json.loads(data).get("deleted", []):
+                            configs.pop(guild_id, None)
+                    elif member.name.startswith("guilds/") and member.name.endswith(".json"):
+                        configs[member.name[len("guilds/"):-len(".json")]] = json.loads(data)
+        return configs
+
+grove_backups = GroveBackups(BACKUP_DIR, BACKUP_FULL_EVERY, BACKUP_KEEP_FULL)
 
 # ================= ADMIN CONTROLS =================
 
 @bot.command(aliases=["backupwhisp"])
 @commands.is_owner()
-async def backupwhisperling(ctx):
-    """📦 Sends the current languages.json as a backup."""
+async def backupwhisperling(ctx, kind: str = "delta"):
+    """📦 Sends a compressed backup: changes since the last one, or `full` for everything."""
     try:
-        file_path = "languages.json"
+        await language_store.checkpoint()
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(None, grove_backups.create, language_store, kind.lower() == "full")
 
-        if not os.path.exists(file_path):
-            await ctx.send("❗ languages.json doesn't exist.")
+        if entry is None:
+            await ctx.send("🌿 Nothing has changed since the last backup. Use `!backupwhisperling full` for a full snapshot.")
             return
 
+        # discord.File reads from the open file as it uploads, so the archive is never held in memory
         await ctx.author.send(
-            content="📂 Here is your current `languages.json` backup:",
-            file=discord.File(file_path)
+            content=(
+                f"📂 Here is your {entry['kind']} backup `{entry['name']}` "
+                f"({entry['guilds']} guilds, {entry['deleted']} removed, {entry['bytes'] / 1024:.1f} KiB):"
+            ),
+            file=discord.File(os.path.join(grove_backups.directory, entry["name"]))
         )
         await ctx.send("✅ Sent you the backup in DMs!")
 
@@ -573,11 +2983,81 @@ async def backupwhisperling(ctx):
     except Exception as e:
         await ctx.send(f"❗ Error sending backup: {e}")
 
+@bot.command(aliases=["restorewhisp"])
+@commands.is_owner()
+async def restorewhisperling(ctx, name: str = None):
+    """♻️ Lists backups, or restores every guild config from one (`latest` or a backup name)."""
+    if name is None:
+        backups = grove_backups.load_manifest()["backups"][-10:]
+        if not backups:
+            await ctx.send("❗ No backups have been made yet.")
+            return
+        lines = [
+            f"`{entry['name']}` · {entry['kind']} · {entry['guilds']} guilds · {entry['bytes'] / 1024:.1f} KiB"
+            for entry in reversed(backups)
+        ]
+        await ctx.send("🗂️ Recent backups (restore with `!restorewhisperling <name>` or `latest`):\n" + "\n".join(lines))
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+        configs = await loop.run_in_executor(None, grove_backups.load, None if name == "latest" else name)
+        if configs is None:
+            await ctx.send(f"❗ Couldn't find a complete backup chain for `{name}`.")
+            return
+
+        all_languages["guilds"] = await language_store.restore(configs)
+        bump_guild_config_version()
+        whispers_enabled_by_guild.clear()  # relearned from the restored configs on each guild's next heartbeat
+        await ctx.send(f"♻️ Restored {len(configs)} guilds from `{name}`.")
+    except Exception as e:
+        await ctx.send(f"❗ Error restoring backup: {e}")
+
+@bot.command(aliases=["translatorstats"])
+@commands.is_owner()
+async def translationstats(ctx):
+    """📊 Shows translation cache, backend and circuit breaker counters."""
+    stats = await translation_service.stats()
+
+    embed = discord.Embed(
+        title="📊 Whisperling's Translation Cache",
+        description=f"Backend: `{stats['backend']}`",
+        color=discord.Color.blurple()
+    )
+    embed.add_field(name="Memory Entries", value=str(stats["memory_entries"]), inline=True)
+    embed.add_field(name="Disk Entries", value=str(stats["disk_entries"]), inline=True)
+    embed.add_field(name="Hit Rate", value=f"{stats['hit_rate']:.1%}", inline=True)
+    embed.add_field(name="Memory Hits", value=str(stats["memory_hits"]), inline=True)
+    embed.add_field(name="Disk Hits", value=str(stats["disk_hits"]), inline=True)
+    embed.add_field(name="Misses", value=str(stats["misses"]), inline=True)
+    embed.add_field(name="Evictions", value=str(stats["evictions"]), inline=True)
+    embed.add_field(name="Backend Requests", value=str(stats["backend_requests"]), inline=True)
+    embed.add_field(name="Coalesced", value=str(stats["coalesced"]), inline=True)
+    embed.add_field(name="In Flight", value=str(stats["inflight"]), inline=True)
+    embed.add_field(name="Timeouts", value=str(stats["timeouts"]), inline=True)
+    embed.add_field(name="Failures", value=str(stats["failures"]), inline=True)
+    embed.add_field(name="Hedged", value=str(stats["hedged"]), inline=True)
+    embed.add_field(name="Skipped Locally", value=str(stats["skipped_locally"]), inline=True)
+    embed.add_field(
+        name="Circuit Breaker",
+        value=(
+            f"`{stats['breaker_state']}` · error rate {stats['error_rate']:.0%} · "
+            f"opened {stats['breaker_opened']}× · rejected {stats['breaker_rejected']}"
+        ),
+        inline=False
+    )
+
+    await ctx.send(embed=embed)
+
 @tree.command(name="adminhelp", description="📘 A magical guide to setting up Whisperling (Admin only)")
 @app_commands.checks.has_permissions(administrator=True)
 async def adminhelp(interaction: discord.Interaction):
     guild_id = str(interaction.guild_id)
     mode = guild_modes.get(guild_id, "dayform")
+    embed = cached_embed("adminhelp", mode, build_adminhelp_embed)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+def build_adminhelp_embed(mode, guild_id=None):
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
     footer = MODE_FOOTERS.get(mode, "Whisperling is ready to help your grove bloom 🌷")
 
@@ -667,6 +3147,7 @@ async def adminhelp(interaction: discord.Interaction):
         name="🌐 Language Tools",
         value=(
             "`!listlanguages` – View active\n"
+            "`!languageusage` – See how many members use each\n"
             "`!removelanguage <code>` – Remove\n"
             "`!langcodes` – View common translation codes"
         ),
@@ -696,7 +3177,7 @@ async def adminhelp(interaction: discord.Interaction):
         inline=False
     )
     embed.set_footer(text=footer)
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    return embed
 
 @bot.command(aliases=["toggleflavor", "togglechatter"])
 @commands.has_permissions(administrator=True)
@@ -705,7 +3186,9 @@ async def togglewhispers(ctx):
     config = all_languages["guilds"].setdefault(guild_id, {})
     current = config.get("whispers_enabled", True)
     config["whispers_enabled"] = not current
-    save_languages()
+    whispers_enabled_by_guild[guild_id] = config["whispers_enabled"]
+    save_languages(guild_id)
+    schedule_heartbeat(guild_id)
 
     status = "enabled" if config["whispers_enabled"] else "disabled"
     await ctx.send(f"🌸 Whisperling's soft whispers are now **{status}**.")
@@ -714,13 +3197,9 @@ async def togglewhispers(ctx):
 async def setmode(ctx, mode: str):
     mode = mode.lower()
     guild = ctx.guild
-    guild_id = str(guild.id)
 
     if mode == "random":
         chosen = random.choice(STANDARD_MODES)
-        previous_standard_mode_by_guild[guild_id] = guild_modes[guild_id]
-        guild_modes[guild_id] = chosen
-        last_interaction_by_guild[guild_id] = datetime.now(timezone.utc)
         await apply_mode_change(guild, chosen)
         await ctx.send(f"🎲 Whisperling closed her eyes and chose **{chosen}**!")
         return
@@ -734,9 +3213,6 @@ async def setmode(ctx, mode: str):
         await ctx.send(f"❗ Unknown form. Choose from: {valid}")
         return
 
-    previous_standard_mode_by_guild[guild_id] = guild_modes[guild_id]
-    guild_modes[guild_id] = mode
-    last_interaction_by_guild[guild_id] = datetime.now(timezone.utc)
     await apply_mode_change(guild, mode)
     await ctx.send(f"🧚 Whisperling now shifts into **{mode}**!")
 
@@ -746,16 +3222,19 @@ async def setmode(ctx, mode: str):
 async def moodcheck(ctx):
     guild_id = str(ctx.guild.id)
     mode = guild_modes.get(guild_id, "dayform")
+    await send_with_avatar(ctx, cached_embed("moodcheck", mode, build_moodcheck_embed), mode)
+
+def build_moodcheck_embed(mode, guild_id=None):
     description = MODE_DESCRIPTIONS.get(mode, "A gentle presence stirs in the grove...")
     footer = MODE_FOOTERS.get(mode, "")
 
-    embed, file = build_whisperling_embed(guild_id, f"🌿 Whisperling’s Current Mood: **{mode}**", description)
+    embed = discord.Embed(
+        title=f"🌿 Whisperling’s Current Mood: **{mode}**",
+        description=description,
+        color=MODE_COLORS.get(mode, discord.Color.green())
+    )
     embed.set_footer(text=footer)
-
-    if file:
-        await ctx.send(embed=embed, file=file)
-    else:
-        await ctx.send(embed=embed)
+    return embed
 
 @bot.command(aliases=["sprachenvorladen", "prélangues", "precargaridiomas"])
 @commands.has_permissions(administrator=True)
@@ -778,7 +3257,7 @@ async def preloadlanguages(ctx):
     if "users" not in all_languages["guilds"][guild_id]:
         all_languages["guilds"][guild_id]["users"] = {}
 
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
@@ -809,7 +3288,7 @@ async def setwelcomechannel(ctx, channel: discord.TextChannel):
         all_languages["guilds"][guild_id]["users"] = {}
 
     all_languages["guilds"][guild_id]["welcome_channel_id"] = channel.id
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
@@ -848,7 +3327,7 @@ async def addlanguage(ctx, code: str, *, name: str):
         "welcome": f"Welcome, {{user}}!"
     }
 
-    save_languages()
+    save_languages(guild_id)
     await ctx.send(f"🦋 Added language: `{name}` with code `{code}`.")
 
 
@@ -867,7 +3346,7 @@ async def removelanguage(ctx, code: str):
         return
 
     del all_languages["guilds"][guild_id]["languages"][code]
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
@@ -909,8 +3388,7 @@ async def assignlanguage(ctx, member: discord.Member, lang_code: str):
         return await ctx.send(f"❗ Invalid language code. Available codes: `{available}`")
 
     # Actually assign language
-    guild_config["users"][user_id] = lang_code
-    save_languages()
+    set_user_language(guild_id, user_id, lang_code)
 
     # 🌿 Mood-flavored embed
     mode = guild_modes.get(guild_id, "dayform")
@@ -944,7 +3422,7 @@ async def setwelcome(ctx, code: str, *, message: str):
         return
 
     languages[code]["welcome"] = message
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
@@ -971,7 +3449,7 @@ async def setrules(ctx, lang_code: str, *, rules: str):
         all_languages["guilds"][guild_id]["rules"] = {}
 
     all_languages["guilds"][guild_id]["rules"][lang_code] = rules
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.green())
@@ -998,7 +3476,7 @@ async def addroleoption(ctx, role: discord.Role, emoji: str, *, label: str):
     role_options = all_languages["guilds"][guild_id].setdefault("role_options", {})
     role_options[str(role.id)] = {"emoji": emoji, "label": label}
 
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
@@ -1025,7 +3503,7 @@ async def removeroleoption(ctx, role: discord.Role):
         return
 
     del role_options[str(role.id)]
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
@@ -1078,7 +3556,7 @@ async def addcosmetic(ctx, role: discord.Role, emoji: str, *, label: str):
     cosmetic_roles = config.setdefault("cosmetic_role_options", {})
     cosmetic_roles[str(role.id)] = {"emoji": emoji, "label": label}
 
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.purple())
@@ -1105,7 +3583,7 @@ async def removecosmetic(ctx, role: discord.Role):
         return
 
     del cosmetic_roles[str(role.id)]
-    save_languages()
+    save_languages(guild_id)
 
     mode = guild_modes.get(guild_id, "dayform")
     embed_color = MODE_COLORS.get(mode, discord.Color.purple())
@@ -1158,13 +3636,16 @@ async def listcosmetics(ctx):
 async def listlanguages(ctx):
     guild_id = str(ctx.guild.id)
     guild_config = all_languages["guilds"].get(guild_id, {})
-    languages = guild_config.get("languages", {})
 
-    if not languages:
+    if not guild_config.get("languages"):
         await ctx.send("❗ No languages configured for this server.")
         return
 
     mode = guild_modes.get(guild_id, "dayform")
+    await ctx.send(embed=cached_embed("listlanguages", mode, build_listlanguages_embed, guild_id))
+
+def build_listlanguages_embed(mode, guild_id):
+    languages = all_languages["guilds"].get(guild_id, {}).get("languages", {})
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
     footer = MODE_FOOTERS.get(mode, "")
 
@@ -1179,6 +3660,34 @@ async def listlanguages(ctx):
         name = data.get("name", f"Unknown ({code})")
         embed.add_field(name=name, value=f"`{code}`", inline=True)
 
+    return embed
+
+@bot.command(aliases=["sprachnutzung", "usagelangues", "usoidiomas"])
+@commands.has_permissions(administrator=True)
+async def languageusage(ctx):
+    guild_id = str(ctx.guild.id)
+    languages = all_languages["guilds"].get(guild_id, {}).get("languages", {})
+    usage = get_language_usage(guild_id)
+
+    if not usage:
+        await ctx.send("❗ No one has chosen a language in this server yet.")
+        return
+
+    mode = guild_modes.get(guild_id, "dayform")
+    embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
+    footer = MODE_FOOTERS.get(mode, "")
+
+    embed = discord.Embed(
+        title="📖 Language Usage",
+        description=f"{sum(usage.values())} members have chosen how they hear the grove:",
+        color=embed_color
+    )
+    embed.set_footer(text=footer)
+
+    for code, count in usage.items():
+        name = languages.get(code, {}).get("name", f"Unknown ({code})")
+        embed.add_field(name=name, value=f"`{code}` · {count} member{'s' if count != 1 else ''}", inline=True)
+
     await ctx.send(embed=embed)
 
 @bot.command(aliases=["willkommenstart", "demarreraccueil", "iniciarbienvenida"])
@@ -1347,14 +3856,13 @@ async def send_language_selector(member, channel, lang_map, guild_config):
 
     # 🎀 Flutterkin glitch chance
     if mode in STANDARD_MODES and random.random() < 0.04:
-        previous_standard_mode_by_guild[guild_id] = mode
-        guild_modes[guild_id] = "flutterkin"
-        glitch_timestamps_by_guild[guild_id] = datetime.now(timezone.utc)
+        set_guild_mode(member.guild, "flutterkin")
         mode = "flutterkin"
 
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
-    intro_title = get_translated_mode_text(guild_id, user_id, mode, "language_intro_title", user=member.mention)
-    intro_desc = get_translated_mode_text(guild_id, user_id, mode, "language_intro_desc", user=member.mention)
+    intro_title, intro_desc = await get_translated_mode_texts(
+        guild_id, user_id, mode, ["language_intro_title", "language_intro_desc"], user=member.mention
+    )
 
     class LanguageView(View):
         def __init__(self):
@@ -1370,7 +3878,7 @@ async def send_language_selector(member, channel, lang_map, guild_config):
 
         async def on_timeout(self):
             try:
-                timeout_msg = get_translated_mode_text(
+                timeout_msg = await get_translated_mode_text(
                     guild_id, user_id, mode, "timeout_language",
                     fallback=f"⏳ {member.mention} Time ran out for language selection.",
                     user=member.mention
@@ -1390,11 +3898,11 @@ async def send_language_selector(member, channel, lang_map, guild_config):
             await interaction.response.send_message("❗ Invalid language code.", ephemeral=True)
             return
 
-        guild_config.setdefault("users", {})[user_id] = selected_code
-        save_languages()
+        set_user_language(guild_id, user_id, selected_code)
 
-        confirm_title = get_translated_mode_text(guild_id, user_id, mode, "language_confirm_title", user=member.mention)
-        confirm_desc = get_translated_mode_text(guild_id, user_id, mode, "language_confirm_desc", user=member.mention)
+        confirm_title, confirm_desc = await get_translated_mode_texts(
+            guild_id, user_id, mode, ["language_confirm_title", "language_confirm_desc"], user=member.mention
+        )
         confirm_embed = discord.Embed(title=confirm_title, description=confirm_desc, color=embed_color)
         await channel.send(content=member.mention, embed=confirm_embed)
 
@@ -1426,11 +3934,18 @@ async def send_rules_embed(member, channel, lang_code, lang_map, guild_config):
 
     # Pull rules text if configured, else fallback flavored message
     rules_text = guild_config.get("rules", {}).get(lang_code)
+    keys = ["rules_intro_title"] if rules_text else ["rules_intro_title", "rules_none"]
+    translated = await get_translated_mode_texts(
+        guild_id, user_id, mode, keys,
+        fallbacks={
+            "rules_intro_title": "📜 Grove Guidelines",
+            "rules_none": "📜 No rules have been set for this grove. Whisperling trusts your good heart, {user}."
+        },
+        user=member.mention
+    )
+    rules_title = translated[0]
     if not rules_text:
-        rules_text = get_translated_mode_text(
-            guild_id, user_id, mode, "rules_none",
-            fallback="📜 No rules have been set for this grove. Whisperling trusts your good heart, {user}."
-        )
+        rules_text = translated[1]
 
     class AcceptRulesView(View):
         def __init__(self):
@@ -1447,7 +3962,7 @@ async def send_rules_embed(member, channel, lang_code, lang_map, guild_config):
 
         async def on_timeout(self):
             try:
-                timeout_msg = get_translated_mode_text(
+                timeout_msg = await get_translated_mode_text(
                     guild_id, user_id, mode, "timeout_rules",
                     fallback=f"⏳ {member.mention} Time ran out to accept the rules.",
                     user=member.mention
@@ -1457,11 +3972,8 @@ async def send_rules_embed(member, channel, lang_code, lang_map, guild_config):
                 print(f"Timeout error on rules: {e}")
 
     async def handle_accept(interaction: discord.Interaction):
-        confirm_title = get_translated_mode_text(
-            guild_id, user_id, mode, "rules_confirm_title", user=member.mention
-        )
-        confirm_desc = get_translated_mode_text(
-            guild_id, user_id, mode, "rules_confirm_desc", user=member.mention
+        confirm_title, confirm_desc = await get_translated_mode_texts(
+            guild_id, user_id, mode, ["rules_confirm_title", "rules_confirm_desc"], user=member.mention
         )
 
         confirm_embed = discord.Embed(title=confirm_title, description=confirm_desc, color=embed_color)
@@ -1478,7 +3990,7 @@ async def send_rules_embed(member, channel, lang_code, lang_map, guild_config):
             item.callback = handle_accept
 
     embed = discord.Embed(
-        title=get_translated_mode_text(guild_id, user_id, mode, "rules_intro_title", fallback="📜 Grove Guidelines"),
+        title=rules_title,
         description=rules_text,
         color=embed_color
     )
@@ -1495,7 +4007,7 @@ async def send_role_selector(member, channel, guild_config):
 
     # 🌿 If no role options are configured, send graceful fallback
     if not role_options:
-        fallback_desc = get_translated_mode_text(
+        fallback_desc = await get_translated_mode_text(
             guild_id, user_id, mode, "role_none",
             fallback="✨ No roles have been configured for you to pick."
         )
@@ -1533,7 +4045,7 @@ async def send_role_selector(member, channel, guild_config):
 
         async def on_timeout(self):
             try:
-                timeout_msg = get_translated_mode_text(
+                timeout_msg = await get_translated_mode_text(
                     guild_id, user_id, mode, "timeout_role",
                     fallback=f"⏳ {member.mention}, time ran out to choose a role.",
                     user=member.mention
@@ -1548,7 +4060,7 @@ async def send_role_selector(member, channel, guild_config):
         if role:
             try:
                 await member.add_roles(role)
-                role_msg = get_translated_mode_text(
+                role_msg = await get_translated_mode_text(
                     guild_id, user_id, mode, "role_granted",
                     role=role.name, user=member.mention
                 )
@@ -1576,11 +4088,10 @@ async def send_role_selector(member, channel, guild_config):
         if isinstance(item, Button):
             item.callback = role_button_callback
 
-    embed = discord.Embed(
-        title=get_translated_mode_text(guild_id, user_id, mode, "role_intro_title", user=member.mention),
-        description=get_translated_mode_text(guild_id, user_id, mode, "role_intro_desc", user=member.mention),
-        color=embed_color
+    role_title, role_desc = await get_translated_mode_texts(
+        guild_id, user_id, mode, ["role_intro_title", "role_intro_desc"], user=member.mention
     )
+    embed = discord.Embed(title=role_title, description=role_desc, color=embed_color)
 
     await channel.send(content=member.mention, embed=embed, view=view)
 
@@ -1595,7 +4106,7 @@ async def send_cosmetic_selector(member, channel, guild_config):
 
     # 🌿 Graceful fallback if no cosmetic options configured
     if not cosmetic_options:
-        fallback_desc = get_translated_mode_text(
+        fallback_desc = await get_translated_mode_text(
             guild_id, user_id, mode, "cosmetic_none",
             fallback="💎 No cosmetics have been configured. You shine just fine!"
         )
@@ -1633,7 +4144,7 @@ async def send_cosmetic_selector(member, channel, guild_config):
 
         async def on_timeout(self):
             try:
-                timeout_msg = get_translated_mode_text(
+                timeout_msg = await get_translated_mode_text(
                     guild_id, user_id, mode, "timeout_cosmetic",
                     fallback=f"⏳ {member.mention}, we didn’t see your sparkle. Come back when you’re ready to glow!",
                     user=member.mention
@@ -1648,7 +4159,7 @@ async def send_cosmetic_selector(member, channel, guild_config):
         selected = interaction.data["custom_id"]
 
         if selected == "skip_cosmetic":
-            skip_msg = get_translated_mode_text(
+            skip_msg = await get_translated_mode_text(
                 guild_id, user_id, mode, "cosmetic_skipped", user=member.mention
             )
             await interaction.response.send_message(skip_msg, ephemeral=True)
@@ -1657,7 +4168,7 @@ async def send_cosmetic_selector(member, channel, guild_config):
             if role:
                 try:
                     await member.add_roles(role)
-                    grant_msg = get_translated_mode_text(
+                    grant_msg = await get_translated_mode_text(
                         guild_id, user_id, mode, "cosmetic_granted", role=role.name, user=member.mention
                     )
                     await interaction.response.send_message(grant_msg, ephemeral=True)
@@ -1675,11 +4186,10 @@ async def send_cosmetic_selector(member, channel, guild_config):
         if isinstance(item, Button):
             item.callback = cosmetic_button_callback
 
-    embed = discord.Embed(
-        title=get_translated_mode_text(guild_id, user_id, mode, "cosmetic_intro_title", user=member.mention),
-        description=get_translated_mode_text(guild_id, user_id, mode, "cosmetic_intro_desc", user=member.mention),
-        color=embed_color
+    cosmetic_title, cosmetic_desc = await get_translated_mode_texts(
+        guild_id, user_id, mode, ["cosmetic_intro_title", "cosmetic_intro_desc"], user=member.mention
     )
+    embed = discord.Embed(title=cosmetic_title, description=cosmetic_desc, color=embed_color)
 
     await channel.send(content=member.mention, embed=embed, view=view)
     return True
@@ -1689,28 +4199,24 @@ async def send_final_welcome(member, channel, lang_code, lang_map):
     user_id = str(member.id)
     mode = guild_modes.get(guild_id, "dayform")
 
-    # ✨ Pull translated welcome title
-    welcome_title = get_translated_mode_text(
-        guild_id, user_id, mode, "welcome_title", fallback="🌿 Welcome!"
-    )
-
     # 💬 Pull custom welcome (guild-defined), fallback to mode-translated default
     admin_welcome = lang_map.get(lang_code, {}).get("welcome")
+    keys = ["welcome_title"] if admin_welcome else ["welcome_title", "welcome_desc"]
+
+    # ✨ Pull translated welcome title (and default description) together
+    translated = await get_translated_mode_texts(
+        guild_id, user_id, mode, keys,
+        fallbacks={"welcome_title": "🌿 Welcome!", "welcome_desc": "Welcome, {user}!"},
+        user=member.mention
+    )
+    welcome_title = translated[0]
     if admin_welcome:
         welcome_desc = admin_welcome.replace("{user}", member.mention)
     else:
-        welcome_desc = get_translated_mode_text(
-            guild_id, user_id, mode, "welcome_desc",
-            fallback="Welcome, {user}!", user=member.mention
-        )
+        welcome_desc = translated[1]
 
     # 🌿 Build embed with proper ID cast
-    embed, file = build_whisperling_embed(str(guild_id), welcome_title, welcome_desc)
-
-    if file:
-        await channel.send(content=member.mention, embed=embed, file=file)
-    else:
-        await channel.send(content=member.mention, embed=embed)
+    await send_whisperling_embed(channel, str(guild_id), welcome_title, welcome_desc, content=member.mention)
 
 # ========== FLUTTERKIN ==========
 
@@ -1740,29 +4246,21 @@ async def whisper(ctx):
 
     # 🌸 Activate Flutterkin mode
     if current_mode != "flutterkin":
-        previous_standard_mode_by_guild[guild_id] = current_mode
-        guild_modes[guild_id] = "flutterkin"
-        glitch_timestamps_by_guild[guild_id] = now
+        set_guild_mode(ctx.guild, "flutterkin")
         await update_avatar_for_mode("flutterkin")
         flutterkin_usage_count_by_guild[guild_id]["count"] += 1
 
     # 🗓️ Update interaction trackers
     flutterkin_last_triggered[guild_id] = now
     last_interaction_by_guild[guild_id] = now
+    schedule_reversion(guild_id)
 
     # 🌼 Sparkle intro
-    intro = get_translated_mode_text(
+    intro = await get_translated_mode_text(
         guild_id, user_id, "flutterkin", "language_confirm_desc",
         user=ctx.author.mention
     )
-    embed, file = build_whisperling_embed(
-        guild_id, "✨ Bouncy Bloom Activated!", intro
-    )
-
-    if file:
-        await ctx.send(embed=embed, file=file)
-    else:
-        await ctx.send(embed=embed)
+    await send_whisperling_embed(ctx, guild_id, "✨ Bouncy Bloom Activated!", intro)
 
     # 🌈 Translation if used as reply
     if ctx.message.reference:
@@ -1779,7 +4277,7 @@ async def whisper(ctx):
                 await ctx.send("🤔 You haven’t chosen a language yet! Pick one first~ 🐞")
                 return
 
-            translated = translator.translate(content, dest=user_lang).text
+            translated = await translation_service.translate_message(replied_msg.id, content, user_lang)
             styled_translated = style_text(guild_id, translated)
 
             await ctx.send(f"💫 Sparkled up for you:\n> {styled_translated}")
@@ -1808,6 +4306,9 @@ async def build_help_embed(interaction_or_ctx):
         # For non-interaction context (regular !help), skip glitch checks
         current_mode = guild_modes.get(guild_id, "dayform")
 
+    return cached_embed("help", current_mode, build_help_template, guild_id)
+
+def build_help_template(current_mode, guild_id):
     embed_color = MODE_COLORS.get(current_mode, discord.Color.blurple())
     description = MODE_DESCRIPTIONS.get(current_mode, "Whisperling shimmers softly in the grove.")
     footer = MODE_FOOTERS.get(current_mode, "Whisperling watches the grove gently...")
@@ -1905,8 +4406,8 @@ async def on_raw_reaction_add(payload: discord.RawReactionActionEvent):
     last_interaction_by_guild[guild_id] = datetime.now(timezone.utc)
 
     try:
-        result = translator.translate(content, dest=user_lang)
-        styled_output = style_text(guild_id, result.text)
+        translated = await translation_service.translate_message(message.id, content, user_lang)
+        styled_output = style_text(guild_id, translated)
 
         embed_color = MODE_COLORS.get(current_mode, discord.Color.blurple())
         footer = MODE_FOOTERS.get(current_mode, "")
@@ -1971,8 +4472,8 @@ async def translate(ctx):
     last_interaction_by_guild[guild_id] = datetime.now(timezone.utc)
 
     try:
-        result = translator.translate(content, dest=user_lang)
-        styled_output = style_text(guild_id, result.text)
+        translated = await translation_service.translate_message(original_msg.id, content, user_lang)
+        styled_output = style_text(guild_id, translated)
 
         embed_color = MODE_COLORS.get(current_mode, discord.Color.blurple())
         footer = MODE_FOOTERS.get(current_mode, "")
@@ -2056,11 +4557,7 @@ async def chooselanguage(ctx):
             await interaction.response.edit_message(content="❌ Cancelled.", embed=None, view=None)
             return
 
-        if "users" not in guild_config:
-            guild_config["users"] = {}
-
-        guild_config["users"][user_id] = selected_code
-        save_languages()
+        set_user_language(guild_id, user_id, selected_code)
 
         lang_name = lang_map[selected_code]["name"]
         await interaction.response.edit_message(
@@ -2078,6 +4575,9 @@ async def chooselanguage(ctx):
 async def langcodes(ctx):
     guild_id = str(ctx.guild.id)
     mode = guild_modes.get(guild_id, "dayform")
+    await ctx.send(embed=cached_embed("langcodes", mode, build_langcodes_embed))
+
+def build_langcodes_embed(mode, guild_id=None):
     embed_color = MODE_COLORS.get(mode, discord.Color.blurple())
     footer = MODE_FOOTERS.get(mode, "🌍 Whisperling is fluent in many tongues...")
 
@@ -2107,6 +4607,10 @@ async def langcodes(ctx):
         embed.add_field(name=f"`{code}`", value=name, inline=True)
 
     embed.set_footer(text=footer)
-    await ctx.send(embed=embed)
+    return embed
 
 bot.run(TOKEN)
+
+# 💾 Make sure pending grove changes reach disk on shutdown
+language_store.flush_now()
+save_grove_snapshot()